@@ -9,6 +9,7 @@ def run(
     port: int = typer.Option(8000, help="Port to bind"),
     reload: bool = typer.Option(False, help="Enable auto-reload"),
     workers: int = typer.Option(1, help="Number of workers"),
+    loop: str = typer.Option("uvloop", help="Event loop implementation (uvloop, asyncio, auto)"),
 ) -> None:
     import uvicorn
 
@@ -18,6 +19,7 @@ def run(
         port=port,
         reload=reload,
         workers=workers if not reload else 1,
+        loop=loop,
     )
 
 
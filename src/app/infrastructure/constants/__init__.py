@@ -1,3 +1,4 @@
+from app.infrastructure.constants.bulk import Bulk
 from app.infrastructure.constants.cache import Cache
 from app.infrastructure.constants.health import HealthStatus
 from app.infrastructure.constants.http import HTTP_STATUS_TITLES, ErrorType
@@ -5,6 +6,7 @@ from app.infrastructure.constants.pagination import Pagination
 from app.infrastructure.constants.seeder import Seeder
 
 __all__ = [
+    "Bulk",
     "Cache",
     "ErrorType",
     "HealthStatus",
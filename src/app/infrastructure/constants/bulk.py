@@ -0,0 +1,2 @@
+class Bulk:
+    CHUNK_SIZE = 1000
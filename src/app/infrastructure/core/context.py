@@ -4,6 +4,9 @@ from typing import Any, cast
 from sqlalchemy.ext.asyncio import AsyncSession
 
 _sessions: ContextVar[dict[str, Any] | None] = ContextVar("db_sessions", default=None)
+_session_factories: ContextVar[dict[str, Any] | None] = ContextVar(
+    "db_session_factories", default=None
+)
 
 DEFAULT_SESSION_NAME = "primary"
 
@@ -19,25 +22,49 @@ class NoSessionError(RuntimeError):
 
 def get_db(name: str = DEFAULT_SESSION_NAME) -> AsyncSession:
     sessions = _sessions.get() or {}
-    if name not in sessions:
+    if name in sessions:
+        return cast(AsyncSession, sessions[name])
+
+    factories = _session_factories.get() or {}
+    if name not in factories:
         raise NoSessionError(name)
-    return cast(AsyncSession, sessions[name])
+
+    # Sessions are created on first use; constructing an AsyncSession does
+    # no I/O, so requests that never touch this database pay nothing.
+    session = factories[name]()
+    _set_session(name, session)
+    return cast(AsyncSession, session)
+
+
+def _seed_sessions() -> None:
+    # The middleware seeds one mutable dict per request in its own context.
+    # Sync endpoints and dependencies run in a threadpool-copied context
+    # where ContextVar.set would be invisible to the middleware; in-place
+    # mutation of the shared dict propagates across those copies.
+    _sessions.set({})
 
 
 def _set_session(name: str, session: Any) -> None:
-    sessions = (_sessions.get() or {}).copy()
+    sessions = _sessions.get()
+    if sessions is None:
+        sessions = {}
+        _sessions.set(sessions)
     sessions[name] = session
-    _sessions.set(sessions)
 
 
 def _remove_session(name: str) -> None:
-    sessions = (_sessions.get() or {}).copy()
-    sessions.pop(name, None)
-    _sessions.set(sessions)
+    sessions = _sessions.get()
+    if sessions is not None:
+        sessions.pop(name, None)
+
+
+def _set_session_factories(factories: dict[str, Any] | None) -> None:
+    _session_factories.set(factories)
 
 
 def _clear_sessions() -> None:
     _sessions.set(None)
+    _session_factories.set(None)
 
 
 def _get_all_sessions() -> dict[str, Any]:
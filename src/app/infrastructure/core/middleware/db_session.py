@@ -1,10 +1,13 @@
 import logging
-import sys
-from typing import Any
 
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.infrastructure.core.context import _clear_sessions, _remove_session, _set_session
+from app.infrastructure.core.context import (
+    _clear_sessions,
+    _get_all_sessions,
+    _seed_sessions,
+    _set_session_factories,
+)
 from app.infrastructure.persistence.adapters import SQLAlchemyAdapter, get_registry
 
 logger = logging.getLogger(__name__)
@@ -20,26 +23,36 @@ class DBSessionMiddleware:
             return
 
         registry = get_registry()
-        context_managers: dict[str, Any] = {}
+        factories = {
+            name: adapter.session_factory
+            for name, adapter in registry
+            if isinstance(adapter, SQLAlchemyAdapter) and adapter.is_connected
+        }
+        # Seed the per-request session dict here so sessions lazily created
+        # inside threadpool-copied contexts still reach _finalize.
+        _seed_sessions()
+        _set_session_factories(factories)
 
         try:
-            for name, adapter in registry:
-                if isinstance(adapter, SQLAlchemyAdapter):
-                    cm = adapter.session()
-                    session = await cm.__aenter__()
-                    context_managers[name] = cm
-                    _set_session(name, session)
-
             await self.app(scope, receive, send)
-
-        finally:
-            exc_info = sys.exc_info()
-            for name in reversed(list(context_managers.keys())):
+        except BaseException:
+            await self._finalize(commit=False)
+            raise
+        else:
+            await self._finalize(commit=True)
+
+    async def _finalize(self, commit: bool) -> None:
+        sessions = _get_all_sessions()
+        try:
+            for name, session in sessions.items():
                 try:
-                    await context_managers[name].__aexit__(*exc_info)
+                    if commit:
+                        await session.commit()
+                    else:
+                        await session.rollback()
                 except Exception:
-                    logger.exception("Failed to close database session '%s'", name)
+                    logger.exception("Failed to finalize database session '%s'", name)
                 finally:
-                    _remove_session(name)
-
+                    await session.close()
+        finally:
             _clear_sessions()
@@ -19,7 +19,7 @@ from app.infrastructure.web.exceptions import (
     http_exception_handler,
     validation_exception_handler,
 )
-from app.infrastructure.web.ratelimit import limiter
+from app.infrastructure.web.ratelimit import RateLimitMiddleware, limiter
 
 
 def create_base_app() -> FastAPI:
@@ -65,6 +65,8 @@ def register_middleware(app: FastAPI) -> None:
     app.add_middleware(RequestLoggingMiddleware)
     app.add_middleware(DBSessionMiddleware)
     app.add_middleware(RequestIdMiddleware)
+    if settings.ratelimit.enabled:
+        app.add_middleware(RateLimitMiddleware)
 
 
 def register_health_routes(app: FastAPI) -> None:
@@ -21,6 +21,7 @@ class SQLConfig:
     max_overflow: int = 10
     pool_pre_ping: bool = True
     pool_recycle: int = 3600
+    prepared_statement_cache_size: int = 512
 
 
 class SQLAlchemyAdapter:
@@ -56,10 +57,10 @@ class SQLAlchemyAdapter:
     def _is_sqlite(self) -> bool:
         return self._config.url.startswith("sqlite")
 
-    async def connect(self) -> None:
-        if self._engine is not None:
-            return
+    def _is_asyncpg(self) -> bool:
+        return "asyncpg" in self._config.url
 
+    def _engine_kwargs(self) -> dict[str, object]:
         engine_kwargs: dict[str, object] = {"echo": self._config.echo}
 
         if not self._is_sqlite():
@@ -72,7 +73,18 @@ class SQLAlchemyAdapter:
                 }
             )
 
-        self._engine = create_async_engine(self._config.url, **engine_kwargs)
+        if self._is_asyncpg():
+            engine_kwargs["prepared_statement_cache_size"] = (
+                self._config.prepared_statement_cache_size
+            )
+
+        return engine_kwargs
+
+    async def connect(self) -> None:
+        if self._engine is not None:
+            return
+
+        self._engine = create_async_engine(self._config.url, **self._engine_kwargs())
         self._session_factory = async_sessionmaker(
             bind=self._engine,
             class_=AsyncSession,
@@ -127,22 +139,10 @@ class ReadOnlySQLAlchemyAdapter(SQLAlchemyAdapter):
         if self._engine is not None:
             return
 
-        engine_kwargs: dict[str, object] = {"echo": self._config.echo}
-
-        if not self._is_sqlite():
-            engine_kwargs.update(
-                {
-                    "pool_size": self._config.pool_size,
-                    "max_overflow": self._config.max_overflow,
-                    "pool_pre_ping": self._config.pool_pre_ping,
-                    "pool_recycle": self._config.pool_recycle,
-                }
-            )
-
         self._engine = create_async_engine(
             self._config.url,
             execution_options={"postgresql_readonly": True, "sqlite_readonly": True},
-            **engine_kwargs,
+            **self._engine_kwargs(),
         )
         self._session_factory = async_sessionmaker(
             bind=self._engine,
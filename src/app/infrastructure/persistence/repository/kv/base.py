@@ -117,6 +117,12 @@ class BaseKeyValueRepository(Generic[T]):
         result = await self._client.hset(self._make_key(key), field, self._serialize(value))
         return bool(result)
 
+    async def hset_many(self, key: str, fields: dict[str, Any]) -> int:
+        if not fields:
+            return 0
+        mapping = {field: self._serialize(value) for field, value in fields.items()}
+        return await self._client.hset(self._make_key(key), mapping=mapping)
+
     async def hgetall(self, key: str) -> dict[str, Any]:
         data = await self._client.hgetall(self._make_key(key))
         return {k: self._deserialize(v) for k, v in data.items()}
@@ -12,6 +12,7 @@ from app.infrastructure.persistence.repository.sql.mixins import (
     SQLSoftDeleteMixin,
     SQLUpsertMixin,
     SQLWriteMixin,
+    _supports_soft_delete,
 )
 
 ModelT = TypeVar("ModelT", bound=Base)
@@ -37,6 +38,8 @@ class BaseSQLRepository(
 ):
     model: type[ModelT]
     adapter_name: str = "primary"
+    _has_soft_delete: bool = False
+    _soft_delete_predicate: Any = None
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -44,6 +47,11 @@ class BaseSQLRepository(
             model_type = _extract_model_type(cls)
             if model_type is not None:
                 cls.model = model_type
+        model = getattr(cls, "model", None)
+        if model is not None:
+            cls._has_soft_delete = _supports_soft_delete(model)
+            if cls._has_soft_delete:
+                cls._soft_delete_predicate = model.is_deleted.is_(False)
 
     def __init__(self, session: AsyncSession | None = None) -> None:
         self._explicit_session = session
@@ -1,14 +1,23 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, cast
 
-from sqlalchemy import CursorResult, delete, func, select, update
+from sqlalchemy import (
+    CursorResult,
+    bindparam,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    select,
+    update,
+)
 
-from app.infrastructure.constants import Pagination
+from app.infrastructure.constants import Bulk, Pagination
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
-    from sqlalchemy.sql import Select
 
     from app.infrastructure.persistence.model import Base
 
@@ -27,24 +36,27 @@ class UpsertStrategy(Protocol):
     ) -> Any: ...
 
 
-def _supports_soft_delete(model: type[Any]) -> bool:
-    return hasattr(model, "is_deleted")
+def _chunked(items: list[str], size: int = Bulk.CHUNK_SIZE) -> Iterator[list[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
 
 
-def _exclude_deleted[SelectT: "Select[Any]"](stmt: SelectT, model: type[Any]) -> SelectT:
-    if _supports_soft_delete(model):
-        stmt = stmt.where(model.is_deleted.is_(False))
-    return stmt
+def _supports_soft_delete(model: type[Any]) -> bool:
+    return hasattr(model, "is_deleted")
 
 
 class SQLReadMixin(Generic[ModelT]):
     model: type[ModelT]
     _session: "AsyncSession"
+    _has_soft_delete: bool
+    _soft_delete_predicate: Any
 
     async def find_by_id(self, entity_id: str, include_deleted: bool = False) -> ModelT | None:
-        stmt = select(self.model).where(self.model.id == entity_id)  # type: ignore[attr-defined]
-        if not include_deleted:
-            stmt = _exclude_deleted(stmt, self.model)
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model))
+        stmt += lambda s: s.where(model.id == entity_id)  # type: ignore[attr-defined]
+        if not include_deleted and self._has_soft_delete:
+            stmt += lambda s: s.where(model.is_deleted.is_(False))  # type: ignore[attr-defined]
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -54,13 +66,27 @@ class SQLReadMixin(Generic[ModelT]):
         limit: int = Pagination.DEFAULT_LIMIT,
         include_deleted: bool = False,
     ) -> list[ModelT]:
-        stmt = select(self.model)
-        if not include_deleted:
-            stmt = _exclude_deleted(stmt, self.model)
-        stmt = stmt.order_by(self.model.id).offset(offset).limit(limit)  # type: ignore[attr-defined]
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model))
+        if not include_deleted and self._has_soft_delete:
+            stmt += lambda s: s.where(model.is_deleted.is_(False))  # type: ignore[attr-defined]
+        stmt += lambda s: s.order_by(model.id).offset(offset).limit(limit)  # type: ignore[attr-defined]
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def iter_all(
+        self,
+        include_deleted: bool = False,
+        chunk_size: int = Pagination.DEFAULT_LIMIT,
+    ) -> AsyncIterator[ModelT]:
+        stmt = select(self.model)
+        if not include_deleted and self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
+        stmt = stmt.order_by(self.model.id).execution_options(yield_per=chunk_size)  # type: ignore[attr-defined]
+        result = await self._session.stream_scalars(stmt)
+        async for entity in result:
+            yield entity
+
     async def find_by_ids(
         self,
         entity_ids: list[str],
@@ -68,11 +94,19 @@ class SQLReadMixin(Generic[ModelT]):
     ) -> list[ModelT]:
         if not entity_ids:
             return []
-        stmt = select(self.model).where(self.model.id.in_(entity_ids))  # type: ignore[attr-defined]
-        if not include_deleted:
-            stmt = _exclude_deleted(stmt, self.model)
-        result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        stmt = select(self.model).where(
+            self.model.id.in_(bindparam("entity_ids", expanding=True))  # type: ignore[attr-defined]
+        )
+        if not include_deleted and self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
+        # Chunked like update_many/delete_many so a large id list cannot
+        # exceed driver parameter limits; the expanding bindparam keeps
+        # one cached statement across chunks.
+        entities: list[ModelT] = []
+        for chunk in _chunked(entity_ids):
+            result = await self._session.execute(stmt, {"entity_ids": chunk})
+            entities.extend(result.scalars().all())
+        return entities
 
     async def find_where(
         self,
@@ -80,21 +114,33 @@ class SQLReadMixin(Generic[ModelT]):
         **conditions: object,
     ) -> list[ModelT]:
         stmt = select(self.model).filter_by(**conditions)
-        if not include_deleted:
-            stmt = _exclude_deleted(stmt, self.model)
+        if not include_deleted and self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
     async def exists(self, entity_id: str) -> bool:
-        stmt = select(func.count()).select_from(self.model).where(self.model.id == entity_id)  # type: ignore[attr-defined]
-        stmt = _exclude_deleted(stmt, self.model)
+        model = self.model
+        stmt = lambda_stmt(lambda: select(literal(1)).select_from(model))
+        stmt += lambda s: s.where(model.id == entity_id).limit(1)  # type: ignore[attr-defined]
+        if self._has_soft_delete:
+            stmt += lambda s: s.where(model.is_deleted.is_(False))  # type: ignore[attr-defined]
         result = await self._session.execute(stmt)
-        return result.scalar_one() > 0
-
-    async def count(self, include_deleted: bool = False) -> int:
-        stmt = select(func.count()).select_from(self.model)
-        if not include_deleted:
-            stmt = _exclude_deleted(stmt, self.model)
+        return result.scalar_one_or_none() is not None
+
+    async def count(self, include_deleted: bool = False, **conditions: object) -> int:
+        model = self.model
+        if conditions:
+            # Dynamic kwargs can't be closed over by lambda_stmt; build the
+            # filtered COUNT directly, mirroring find_where.
+            filtered = select(func.count()).select_from(model).filter_by(**conditions)
+            if not include_deleted and self._has_soft_delete:
+                filtered = filtered.where(self._soft_delete_predicate)
+            result = await self._session.execute(filtered)
+            return result.scalar_one()
+        stmt = lambda_stmt(lambda: select(func.count()).select_from(model))
+        if not include_deleted and self._has_soft_delete:
+            stmt += lambda s: s.where(model.is_deleted.is_(False))  # type: ignore[attr-defined]
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
@@ -102,8 +148,15 @@ class SQLReadMixin(Generic[ModelT]):
 class SQLWriteMixin(Generic[ModelT]):
     model: type[ModelT]
     _session: "AsyncSession"
+    _upsert_strategy: UpsertStrategy
+    _has_soft_delete: bool
+    _soft_delete_predicate: Any
 
     async def create(self, data: dict[str, object]) -> ModelT:
+        if self._upsert_strategy.supports_returning:
+            stmt = insert(self.model).values(**data).returning(self.model)
+            result = await self._session.execute(stmt)
+            return result.scalar_one()
         entity = self.model(**data)
         self._session.add(entity)
         await self._session.flush()
@@ -117,8 +170,8 @@ class SQLWriteMixin(Generic[ModelT]):
             .values(**data)
             .returning(self.model)
         )
-        if _supports_soft_delete(self.model):
-            stmt = stmt.where(self.model.is_deleted.is_(False))  # type: ignore[attr-defined]
+        if self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
         result = await self._session.execute(stmt)
         entity = result.scalar_one_or_none()
         if entity:
@@ -126,7 +179,7 @@ class SQLWriteMixin(Generic[ModelT]):
         return entity
 
     async def delete(self, entity_id: str, hard: bool = False) -> bool:
-        if hard or not _supports_soft_delete(self.model):
+        if hard or not self._has_soft_delete:
             return await self._hard_delete(entity_id)
         return await self._soft_delete(entity_id)
 
@@ -149,10 +202,21 @@ class SQLWriteMixin(Generic[ModelT]):
 class SQLBulkMixin(Generic[ModelT]):
     model: type[ModelT]
     _session: "AsyncSession"
+    _upsert_strategy: UpsertStrategy
+    _has_soft_delete: bool
+    _soft_delete_predicate: Any
 
     async def create_many(self, items: Sequence[dict[str, object]]) -> list[ModelT]:
         if not items:
             return []
+        if self._upsert_strategy.supports_returning:
+            # Single INSERT ... RETURNING round trip instead of
+            # add_all + flush + one refresh per row. Callers consume the
+            # result positionally, and insertmanyvalues does not guarantee
+            # row order without sort_by_parameter_order.
+            stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            result = await self._session.execute(stmt, list(items))
+            return list(result.scalars().all())
         entities = [self.model(**item) for item in items]
         self._session.add_all(entities)
         await self._session.flush()
@@ -163,33 +227,43 @@ class SQLBulkMixin(Generic[ModelT]):
     async def update_many(self, entity_ids: list[str], data: dict[str, object]) -> int:
         if not entity_ids:
             return 0
-        stmt = update(self.model).where(self.model.id.in_(entity_ids)).values(**data)  # type: ignore[attr-defined]
-        if _supports_soft_delete(self.model):
-            stmt = stmt.where(self.model.is_deleted.is_(False))  # type: ignore[attr-defined]
-        result = cast(CursorResult[Any], await self._session.execute(stmt))
-        return result.rowcount
+        total = 0
+        for chunk in _chunked(entity_ids):
+            stmt = update(self.model).where(self.model.id.in_(chunk)).values(**data)  # type: ignore[attr-defined]
+            if self._has_soft_delete:
+                stmt = stmt.where(self._soft_delete_predicate)
+            result = cast(CursorResult[Any], await self._session.execute(stmt))
+            total += result.rowcount
+        return total
 
     async def delete_many(self, entity_ids: list[str], hard: bool = False) -> int:
         if not entity_ids:
             return 0
-        if hard or not _supports_soft_delete(self.model):
+        if hard or not self._has_soft_delete:
             return await self._hard_delete_many(entity_ids)
         return await self._soft_delete_many(entity_ids)
 
     async def _hard_delete_many(self, entity_ids: list[str]) -> int:
-        stmt = delete(self.model).where(self.model.id.in_(entity_ids))  # type: ignore[attr-defined]
-        result = cast(CursorResult[Any], await self._session.execute(stmt))
-        return result.rowcount
+        total = 0
+        for chunk in _chunked(entity_ids):
+            stmt = delete(self.model).where(self.model.id.in_(chunk))  # type: ignore[attr-defined]
+            result = cast(CursorResult[Any], await self._session.execute(stmt))
+            total += result.rowcount
+        return total
 
     async def _soft_delete_many(self, entity_ids: list[str]) -> int:
-        stmt = (
-            update(self.model)
-            .where(self.model.id.in_(entity_ids))  # type: ignore[attr-defined]
-            .where(self.model.is_deleted.is_(False))  # type: ignore[attr-defined]
-            .values(is_deleted=True, deleted_at=datetime.now(UTC))
-        )
-        result = cast(CursorResult[Any], await self._session.execute(stmt))
-        return result.rowcount
+        deleted_at = datetime.now(UTC)
+        total = 0
+        for chunk in _chunked(entity_ids):
+            stmt = (
+                update(self.model)
+                .where(self.model.id.in_(chunk))  # type: ignore[attr-defined]
+                .where(self.model.is_deleted.is_(False))  # type: ignore[attr-defined]
+                .values(is_deleted=True, deleted_at=deleted_at)
+            )
+            result = cast(CursorResult[Any], await self._session.execute(stmt))
+            total += result.rowcount
+        return total
 
 
 class SQLPaginationMixin(SQLReadMixin[ModelT], Generic[ModelT]):
@@ -199,15 +273,18 @@ class SQLPaginationMixin(SQLReadMixin[ModelT], Generic[ModelT]):
         page_size: int = Pagination.DEFAULT_PAGE_SIZE,
         include_deleted: bool = False,
     ) -> tuple[list[ModelT], int]:
-        total = await self.count(include_deleted=include_deleted)
         offset = (page - 1) * page_size
-        stmt = select(self.model)
-        if not include_deleted:
-            stmt = _exclude_deleted(stmt, self.model)
+        stmt = select(self.model, func.count().over())
+        if not include_deleted and self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
         stmt = stmt.order_by(self.model.id).offset(offset).limit(page_size)  # type: ignore[attr-defined]
         result = await self._session.execute(stmt)
-        items = list(result.scalars().all())
-        return items, total
+        rows = result.all()
+        if not rows:
+            total = await self.count(include_deleted=include_deleted)
+            return [], total
+        items = [row[0] for row in rows]
+        return items, rows[0][1]
 
     async def find_by_cursor(
         self,
@@ -216,8 +293,8 @@ class SQLPaginationMixin(SQLReadMixin[ModelT], Generic[ModelT]):
         include_deleted: bool = False,
     ) -> list[ModelT]:
         stmt = select(self.model)
-        if not include_deleted:
-            stmt = _exclude_deleted(stmt, self.model)
+        if not include_deleted and self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
         if cursor:
             stmt = stmt.where(self.model.id > cursor)  # type: ignore[attr-defined]
         stmt = stmt.order_by(self.model.id).limit(limit + 1)  # type: ignore[attr-defined]
@@ -228,9 +305,10 @@ class SQLPaginationMixin(SQLReadMixin[ModelT], Generic[ModelT]):
 class SQLSoftDeleteMixin(Generic[ModelT]):
     model: type[ModelT]
     _session: "AsyncSession"
+    _has_soft_delete: bool
 
     async def restore(self, entity_id: str) -> ModelT | None:
-        if not _supports_soft_delete(self.model):
+        if not self._has_soft_delete:
             return None
         stmt = (
             update(self.model)
@@ -250,6 +328,8 @@ class SQLUpsertMixin(Generic[ModelT]):
     model: type[ModelT]
     _session: "AsyncSession"
     _upsert_strategy: UpsertStrategy
+    _has_soft_delete: bool
+    _soft_delete_predicate: Any
 
     async def upsert(
         self,
@@ -261,15 +341,18 @@ class SQLUpsertMixin(Generic[ModelT]):
         stmt = self._upsert_strategy.build_upsert(
             self.model, data, conflict_fields, fields_to_update
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
 
         if self._upsert_strategy.supports_returning:
-            await self._session.flush()
+            # The strategy already appended RETURNING; consuming it keeps
+            # the upsert to a single round trip instead of a follow-up
+            # SELECT on the conflict fields.
+            return cast(ModelT, result.scalar_one())
 
         filters = {field: data[field] for field in conflict_fields}
         query = select(self.model).filter_by(**filters)
-        result = await self._session.execute(query)
-        return result.scalar_one()
+        fallback = await self._session.execute(query)
+        return fallback.scalar_one()
 
     async def find_or_create(
         self,
@@ -277,7 +360,8 @@ class SQLUpsertMixin(Generic[ModelT]):
         **filters: object,
     ) -> tuple[ModelT, bool]:
         stmt = select(self.model).filter_by(**filters)
-        stmt = _exclude_deleted(stmt, self.model)
+        if self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
         result = await self._session.execute(stmt)
         existing = result.scalar_one_or_none()
         if existing:
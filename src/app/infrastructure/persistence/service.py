@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any, Generic, NoReturn, TypeVar, cast, get_args, get_origin
 
 from app.infrastructure.constants import Pagination
@@ -61,6 +62,14 @@ class BaseService(Generic[ModelT, RepoT]):
     ) -> list[ModelT]:
         return await self._repo.find_all(offset, limit, include_deleted)
 
+    async def iter_all(
+        self,
+        include_deleted: bool = False,
+        chunk_size: int = Pagination.DEFAULT_LIMIT,
+    ) -> AsyncIterator[ModelT]:
+        async for entity in self._repo.iter_all(include_deleted, chunk_size):
+            yield cast(ModelT, entity)
+
     async def find_paginated(
         self,
         page: int = 1,
@@ -1,11 +1,16 @@
+import re
 from typing import Annotated
-from uuid import UUID
 
 from pydantic import AfterValidator
 
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
 
 def _validate_uuid(value: str) -> str:
-    UUID(value)
+    if not _UUID_RE.match(value):
+        raise ValueError("Invalid UUID format")
     return value
 
 
@@ -23,7 +23,7 @@ from app.infrastructure.web.pagination import (
     encode_cursor,
     paginate,
 )
-from app.infrastructure.web.ratelimit import limiter
+from app.infrastructure.web.ratelimit import RateLimitMiddleware, limiter
 from app.infrastructure.web.websocket import ConnectionManager, manager
 
 __all__ = [
@@ -40,6 +40,7 @@ __all__ = [
     "PaginatedResponse",
     "ProblemDetail",
     "RateLimitError",
+    "RateLimitMiddleware",
     "UnauthorizedError",
     "ValidationError",
     "app_exception_handler",
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 from starlette.requests import Request
@@ -17,6 +17,8 @@ class ProblemDetail(BaseModel):
 
 
 class AppException(Exception):
+    title: ClassVar[str] = ""
+
     def __init__(
         self,
         message: str,
@@ -33,7 +35,7 @@ class AppException(Exception):
         super().__init__(message)
 
     def to_problem_detail(self, request: Request) -> ProblemDetail:
-        return ProblemDetail(
+        return ProblemDetail.model_construct(
             type=self.error_type,
             title=self._get_title(),
             status=self.status_code,
@@ -44,4 +46,4 @@ class AppException(Exception):
         )
 
     def _get_title(self) -> str:
-        return HTTP_STATUS_TITLES.get(self.status_code, "Error")
+        return self.title or HTTP_STATUS_TITLES.get(self.status_code, "Error")
@@ -1,39 +1,41 @@
 from fastapi import HTTPException
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from starlette.requests import Request
+from starlette.responses import Response
 
 from app.infrastructure.web.exceptions.base import AppException, ProblemDetail
 
+PROBLEM_JSON_MEDIA_TYPE = "application/problem+json"
 
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
-    problem = exc.to_problem_detail(request)
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=problem.model_dump(exclude_none=True),
-        media_type="application/problem+json",
+
+def _problem_response(problem: ProblemDetail, status_code: int) -> Response:
+    return Response(
+        content=problem.model_dump_json(exclude_none=True),
+        status_code=status_code,
+        media_type=PROBLEM_JSON_MEDIA_TYPE,
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
-    problem = ProblemDetail(
+async def app_exception_handler(request: Request, exc: AppException) -> Response:
+    problem = exc.to_problem_detail(request)
+    return _problem_response(problem, exc.status_code)
+
+
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
+    problem = ProblemDetail.model_construct(
         type="about:blank",
         title="HTTP Error",
         status=exc.status_code,
         detail=str(exc.detail),
         instance=str(request.url),
     )
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=problem.model_dump(exclude_none=True),
-        media_type="application/problem+json",
-    )
+    return _problem_response(problem, exc.status_code)
 
 
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> Response:
     errors = []
     for error in exc.errors():
         loc = error.get("loc", ())
@@ -46,7 +48,7 @@ async def validation_exception_handler(
             }
         )
 
-    problem = ProblemDetail(
+    problem = ProblemDetail.model_construct(
         type="/errors/validation",
         title="Validation Error",
         status=422,
@@ -54,8 +56,4 @@ async def validation_exception_handler(
         instance=str(request.url),
         errors=errors,
     )
-    return JSONResponse(
-        status_code=422,
-        content=problem.model_dump(exclude_none=True),
-        media_type="application/problem+json",
-    )
+    return _problem_response(problem, 422)
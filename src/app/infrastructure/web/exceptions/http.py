@@ -1,10 +1,12 @@
-from typing import Any
+from typing import Any, ClassVar
 
 from app.infrastructure.constants import ErrorType
 from app.infrastructure.web.exceptions.base import AppException
 
 
 class NotFoundError(AppException):
+    title: ClassVar[str] = "Not Found"
+
     def __init__(self, resource: str, identifier: Any) -> None:
         super().__init__(
             message=f"{resource} with id '{identifier}' not found",
@@ -15,6 +17,8 @@ class NotFoundError(AppException):
 
 
 class ValidationError(AppException):
+    title: ClassVar[str] = "Validation Error"
+
     def __init__(
         self,
         message: str,
@@ -29,6 +33,8 @@ class ValidationError(AppException):
 
 
 class ConflictError(AppException):
+    title: ClassVar[str] = "Conflict"
+
     def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
         super().__init__(
             message=message,
@@ -39,6 +45,8 @@ class ConflictError(AppException):
 
 
 class UnauthorizedError(AppException):
+    title: ClassVar[str] = "Unauthorized"
+
     def __init__(self, message: str = "Authentication required") -> None:
         super().__init__(
             message=message,
@@ -48,6 +56,8 @@ class UnauthorizedError(AppException):
 
 
 class ForbiddenError(AppException):
+    title: ClassVar[str] = "Forbidden"
+
     def __init__(self, message: str = "Access denied") -> None:
         super().__init__(
             message=message,
@@ -57,6 +67,8 @@ class ForbiddenError(AppException):
 
 
 class RateLimitError(AppException):
+    title: ClassVar[str] = "Too Many Requests"
+
     def __init__(self, message: str = "Rate limit exceeded") -> None:
         super().__init__(
             message=message,
@@ -1,6 +1,6 @@
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
 
 if TYPE_CHECKING:
     from app.infrastructure.web.pagination.schemas import PaginatedResponse
@@ -31,10 +31,18 @@ class PageResult(Generic[T]):
     def to_response(
         self,
         item_mapper: Callable[[T], R] | None = None,
+        *,
+        batch_mapper: Callable[[list[T]], list[R]] | None = None,
     ) -> "PaginatedResponse[R]":
         from app.infrastructure.web.pagination.schemas import PaginatedResponse
 
-        items = [item_mapper(item) for item in self.items] if item_mapper else self.items
+        if batch_mapper is not None:
+            items = batch_mapper(self.items)
+        elif item_mapper:
+            items = [item_mapper(item) for item in self.items]
+        else:
+            # No mapper means the caller is returning items as-is, i.e. R is T.
+            items = cast("list[R]", self.items)
         return PaginatedResponse(
             items=items,
             total=self.total,
@@ -1,18 +1,21 @@
-from base64 import b64decode, b64encode
 from binascii import Error as BinasciiError
+from binascii import a2b_base64, b2a_base64
+from functools import lru_cache
 from typing import Any
 
 from app.infrastructure.constants import Pagination
 from app.infrastructure.web.pagination.result import CursorResult, PageResult
 
 
+@lru_cache(maxsize=4096)
 def encode_cursor(value: str) -> str:
-    return b64encode(value.encode()).decode()
+    return b2a_base64(value.encode(), newline=False).decode()
 
 
+@lru_cache(maxsize=4096)
 def decode_cursor(cursor: str) -> str | None:
     try:
-        return b64decode(cursor.encode()).decode()
+        return a2b_base64(cursor.encode()).decode()
     except (BinasciiError, UnicodeDecodeError, ValueError):
         return None
 
@@ -39,15 +42,18 @@ def cursor_paginate(
 ) -> CursorResult[Any]:
     has_next = len(items) > limit
     if has_next:
-        items = items[:limit]
+        # Drop the sentinel row in place instead of copying the page.
+        del items[limit:]
 
     next_cursor = None
     if has_next and items:
         last_item = items[-1]
-        if hasattr(last_item, cursor_field):
-            next_cursor = encode_cursor(str(getattr(last_item, cursor_field)))
-        elif isinstance(last_item, dict):
-            next_cursor = encode_cursor(str(last_item.get(cursor_field, "")))
+        try:
+            cursor_value = getattr(last_item, cursor_field)
+        except AttributeError:
+            cursor_value = last_item.get(cursor_field, "") if isinstance(last_item, dict) else None
+        if cursor_value is not None:
+            next_cursor = encode_cursor(str(cursor_value))
 
     prev_cursor = None
     if prev_cursor_value:
@@ -1,17 +1,188 @@
+import time
+from collections import OrderedDict
+from itertools import count as _counter
+from typing import Any
+
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import settings
 
+_WINDOW_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+MAX_LOCAL_BUCKETS = 100_000
+
+_RATE_LIMITED_BODY = (
+    b'{"type":"/errors/rate-limit","title":"Too Many Requests",'
+    b'"status":429,"detail":"Rate limit exceeded"}'
+)
+
 
 def _key_func(request: Request) -> str:
     return get_remote_address(request) or "anonymous"
 
 
+def parse_limit(spec: str) -> tuple[int, int]:
+    """Parse a slowapi-style limit spec into ``(count, window_seconds)``.
+
+    Accepts the shapes slowapi itself does: ``"100/minute"``,
+    ``"100 per minute"``, and an optional window multiplier such as
+    ``"10/3 seconds"``.
+    """
+    normalized = spec.strip().lower().replace(" per ", "/")
+    count_part, _, period_part = normalized.partition("/")
+    multiplier_part, _, granularity = period_part.strip().rpartition(" ")
+    try:
+        count = int(count_part)
+        multiplier = int(multiplier_part) if multiplier_part else 1
+        seconds = _WINDOW_SECONDS[granularity.removesuffix("s")] * multiplier
+    except (ValueError, KeyError):
+        raise ValueError(
+            f"Invalid rate limit spec {spec!r}: expected '<count>/<period>' or "
+            "'<count> per <period>' with a period of second, minute, hour or day "
+            "(e.g. '100/minute')"
+        ) from None
+    return count, seconds
+
+
 limiter = Limiter(
     key_func=_key_func,
     default_limits=[settings.ratelimit.default] if settings.ratelimit.enabled else [],
     enabled=settings.ratelimit.enabled,
     storage_uri=settings.databases.redis.url if settings.databases.redis.enabled else None,
 )
+
+
+async def _send_rate_limited(send: Send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/problem+json"),
+                (b"content-length", str(len(_RATE_LIMITED_BODY)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": _RATE_LIMITED_BODY})
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "rate", "capacity", "last")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    def acquire(self, now: float) -> bool:
+        elapsed = now - self.last
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class RedisSlidingWindow:
+    """Sliding-window counter backed by a Redis sorted set.
+
+    The whole check runs as one Lua script (single round trip, atomic):
+    expired members are trimmed, the current request is added, and the
+    remaining cardinality is compared against the limit.
+    """
+
+    _SCRIPT = """
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1] - ARGV[2])
+    redis.call('ZADD', KEYS[1], ARGV[1], ARGV[3])
+    local count = redis.call('ZCARD', KEYS[1])
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return count
+    """
+
+    def __init__(self, limit: int, window_seconds: int) -> None:
+        self._limit = limit
+        self._window_ms = window_seconds * 1000
+        self._script: Any = None
+        self._seq = _counter()
+
+    async def allow(self, key: str) -> bool:
+        from app.infrastructure.messaging.cache import get_redis
+
+        client = await get_redis()
+        if self._script is None:
+            self._script = client.register_script(self._SCRIPT)
+        now_ms = int(time.time() * 1000)
+        member = f"{now_ms}-{next(self._seq)}"
+        current = await self._script(
+            keys=[f"ratelimit:{key}"],
+            args=[now_ms, self._window_ms, member],
+        )
+        return int(current) <= self._limit
+
+
+class RateLimitMiddleware:
+    """Pure ASGI rate limiter.
+
+    Checks the client budget before any Starlette Request object is built,
+    so throttled traffic is rejected without touching the routing stack.
+    """
+
+    def __init__(self, app: ASGIApp, limit: str | None = None) -> None:
+        self.app = app
+        self._limit, self._window = parse_limit(limit or settings.ratelimit.default)
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._redis_window = (
+            RedisSlidingWindow(self._limit, self._window)
+            if settings.databases.redis.enabled
+            else None
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        key = client[0] if client else "anonymous"
+        if not await self._allow(key):
+            await _send_rate_limited(send)
+            return
+
+        await self.app(scope, receive, send)
+
+    async def _allow(self, key: str) -> bool:
+        # Traffic within the configured rate is admitted from the local
+        # bucket without a network hop; only clients that have drained
+        # their bucket pay the Redis round trip for the cluster-wide
+        # decision.
+        if self._allow_local(key):
+            return True
+        if self._redis_window is not None:
+            try:
+                return await self._redis_window.allow(key)
+            except Exception:
+                # Redis being unreachable should not take the API down.
+                pass
+        return False
+
+    def _allow_local(self, key: str) -> bool:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate=self._limit / self._window, capacity=self._limit)
+            self._buckets[key] = bucket
+            if len(self._buckets) > MAX_LOCAL_BUCKETS:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.acquire(time.monotonic())
@@ -1,56 +1,103 @@
 import asyncio
+import json
+import os
 from typing import Any
 
 from fastapi import WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
 
 from app.infrastructure.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_SHARD_COUNT = 4 * (os.cpu_count() or 1)
+DEFAULT_BROADCAST_CONCURRENCY = 64
+DEFAULT_SEND_TIMEOUT = 1.0
+
+
+class ConnEntry:
+    __slots__ = ("websocket",)
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+
 
 class ConnectionManager:
-    def __init__(self) -> None:
-        self._connections: dict[str, WebSocket] = {}
-        self._lock = asyncio.Lock()
+    def __init__(self, shard_count: int = DEFAULT_SHARD_COUNT) -> None:
+        self._shards: list[dict[str, ConnEntry]] = [{} for _ in range(shard_count)]
+
+    def _shard(self, connection_id: str) -> dict[str, ConnEntry]:
+        return self._shards[hash(connection_id) % len(self._shards)]
 
     async def connect(self, connection_id: str, websocket: WebSocket) -> None:
         await websocket.accept()
-        async with self._lock:
-            self._connections[connection_id] = websocket
+        self._shard(connection_id)[connection_id] = ConnEntry(websocket)
         logger.info("websocket_connected", connection_id=connection_id)
 
     async def disconnect(self, connection_id: str) -> None:
-        async with self._lock:
-            self._connections.pop(connection_id, None)
+        self._shard(connection_id).pop(connection_id, None)
         logger.info("websocket_disconnected", connection_id=connection_id)
 
     async def send_personal(self, connection_id: str, message: dict[str, Any]) -> bool:
-        async with self._lock:
-            websocket = self._connections.get(connection_id)
-        if websocket:
+        entry = self._shard(connection_id).get(connection_id)
+        if entry:
             try:
-                await websocket.send_json(message)
+                await entry.websocket.send_json(message)
                 return True
             except WebSocketDisconnect:
                 await self.disconnect(connection_id)
         return False
 
-    async def broadcast(self, message: dict[str, Any], exclude: set[str] | None = None) -> int:
-        exclude = exclude or set()
+    async def broadcast(
+        self,
+        message: dict[str, Any],
+        exclude: set[str] | None = None,
+        concurrency: int = DEFAULT_BROADCAST_CONCURRENCY,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
+    ) -> int:
+        if not any(self._shards):
+            return 0
+
+        # Snapshot via C-level dict.update instead of materializing a list
+        # of (id, entry) tuples per broadcast.
+        snapshot: dict[str, ConnEntry] = {}
+        for shard in self._shards:
+            if shard:
+                snapshot.update(shard)
+        if exclude:
+            for connection_id in exclude:
+                snapshot.pop(connection_id, None)
+        if not snapshot:
+            return 0
+
+        payload = json.dumps(message, separators=(",", ":"))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _send(websocket: WebSocket) -> None:
+            async with semaphore:
+                await asyncio.wait_for(websocket.send_text(payload), timeout=send_timeout)
+
         sent = 0
         disconnected = []
+        pending: list[str] = []
+        coros = []
+        for connection_id, entry in snapshot.items():
+            # Cheap state check up front so dead clients never cost an
+            # exception; the timeout below evicts slow ones instead of
+            # letting a full buffer back-pressure the whole broadcast.
+            if entry.websocket.client_state != WebSocketState.CONNECTED:
+                disconnected.append(connection_id)
+                continue
+            pending.append(connection_id)
+            coros.append(_send(entry.websocket))
 
-        async with self._lock:
-            connections = list(self._connections.items())
+        results = await asyncio.gather(*coros, return_exceptions=True)
 
-        for connection_id, websocket in connections:
-            if connection_id in exclude:
-                continue
-            try:
-                await websocket.send_json(message)
-                sent += 1
-            except WebSocketDisconnect:
+        for connection_id, result in zip(pending, results, strict=True):
+            if isinstance(result, WebSocketDisconnect | TimeoutError):
                 disconnected.append(connection_id)
+            elif not isinstance(result, BaseException):
+                sent += 1
 
         for connection_id in disconnected:
             await self.disconnect(connection_id)
@@ -59,10 +106,10 @@ class ConnectionManager:
 
     @property
     def active_connections(self) -> int:
-        return len(self._connections)
+        return sum(len(shard) for shard in self._shards)
 
     def is_connected(self, connection_id: str) -> bool:
-        return connection_id in self._connections
+        return connection_id in self._shard(connection_id)
 
 
 manager = ConnectionManager()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
@@ -5,6 +6,7 @@ from fastapi import Depends
 from app.modules.todos.service import TodoService
 
 
+@lru_cache(maxsize=1)
 def get_todo_service() -> TodoService:
     return TodoService()
 
@@ -1,8 +1,9 @@
+from typing import cast
+
 from sqlalchemy import func, select
 
 from app.infrastructure.constants import Pagination
 from app.infrastructure.persistence.repository.sql import BaseSQLRepository
-from app.infrastructure.persistence.repository.sql.mixins import _exclude_deleted
 from app.modules.todos.model import Todo
 
 
@@ -15,11 +16,30 @@ class TodoRepository(BaseSQLRepository[Todo]):
         include_deleted: bool = False,
     ) -> list[Todo]:
         stmt = select(self.model).where(self.model.completed == completed)
-        if not include_deleted:
-            stmt = _exclude_deleted(stmt, self.model)
+        if not include_deleted and self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
         stmt = stmt.offset(offset).limit(limit)
         result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        # scalars().all() already materializes a list; avoid copying it.
+        return cast(list[Todo], result.scalars().all())
+
+    async def find_by_status_with_total(
+        self,
+        completed: bool,
+        offset: int = 0,
+        limit: int = Pagination.DEFAULT_LIMIT,
+        include_deleted: bool = False,
+    ) -> tuple[list[Todo], int]:
+        stmt = select(self.model, func.count().over()).where(self.model.completed == completed)
+        if not include_deleted and self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
+        stmt = stmt.order_by(self.model.id).offset(offset).limit(limit)
+        result = await self._session.execute(stmt)
+        rows = result.all()
+        if not rows:
+            total = await self.count_by_status(completed, include_deleted)
+            return [], total
+        return [row[0] for row in rows], rows[0][1]
 
     async def count_by_status(self, completed: bool, include_deleted: bool = False) -> int:
         stmt = (
@@ -27,7 +47,7 @@ class TodoRepository(BaseSQLRepository[Todo]):
             .select_from(self.model)
             .where(self.model.completed == completed)
         )
-        if not include_deleted:
-            stmt = _exclude_deleted(stmt, self.model)
+        if not include_deleted and self._has_soft_delete:
+            stmt = stmt.where(self._soft_delete_predicate)
         result = await self._session.execute(stmt)
         return result.scalar_one()
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Response, status
 
 from app.infrastructure.constants import Pagination
 from app.infrastructure.types import TodoId
 from app.modules.todos.dependencies import TodoServiceDep
-from app.modules.todos.schemas import TodoCreate, TodoListResponse, TodoResponse, TodoUpdate
+from app.modules.todos.schemas import (
+    TODO_LIST_ADAPTER,
+    TodoCreate,
+    TodoListResponse,
+    TodoResponse,
+    TodoUpdate,
+)
 
 router = APIRouter(prefix="/todos", tags=["todos"])
 
@@ -14,9 +20,12 @@ async def list_todos(
     page: int = Query(1, ge=1),
     page_size: int = Query(Pagination.DEFAULT_PAGE_SIZE, ge=1, le=Pagination.MAX_PAGE_SIZE),
     completed: bool | None = None,
-) -> TodoListResponse:
+) -> Response:
     result = await service.find_paginated(page=page, page_size=page_size, completed=completed)
-    return result.to_response(TodoResponse.model_validate)
+    response = result.to_response(batch_mapper=TODO_LIST_ADAPTER.validate_python)
+    # Items were just validated above; serialize once and skip FastAPI's
+    # response_model re-validation and jsonable_encoder pass.
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{todo_id}", response_model=TodoResponse)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from app.infrastructure.types import TodoId
 from app.infrastructure.web.pagination import PaginatedResponse
@@ -29,3 +29,7 @@ class TodoResponse(BaseModel):
 
 
 TodoListResponse = PaginatedResponse[TodoResponse]
+
+# Validates a whole page in one pydantic-core call instead of one
+# model_validate call per row.
+TODO_LIST_ADAPTER = TypeAdapter(list[TodoResponse])
@@ -25,14 +25,12 @@ class TodoSeeder(Seeder):
         self.service = TodoService()
 
     async def run(self, count: int = SeederDefaults.DEFAULT_COUNT) -> int:
-        created = 0
-        for data in SAMPLE_TODOS[:count]:
-            await self.service.create_todo(data["title"], data["description"])
-            created += 1
-        return created
+        items: list[dict[str, object]] = [dict(data) for data in SAMPLE_TODOS[:count]]
+        created = await self.service.create_many(items)
+        return len(created)
 
     async def clear(self) -> int:
         todos = await self.service.find_all(limit=SeederDefaults.CLEAR_FETCH_LIMIT)
-        for todo in todos:
-            await self.service.delete(todo.id, hard=True)
-        return len(todos)
+        if not todos:
+            return 0
+        return await self.service.delete_many([todo.id for todo in todos], hard=True)
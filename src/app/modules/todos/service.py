@@ -27,8 +27,7 @@ class TodoService(BaseService[Todo, TodoRepository]):
     ) -> PageResult[Todo]:
         if completed is not None:
             offset = (page - 1) * page_size
-            items = await self._repo.find_by_status(completed, offset, page_size)
-            total = await self._repo.count_by_status(completed)
+            items, total = await self._repo.find_by_status_with_total(completed, offset, page_size)
         else:
             items, total = await self._repo.find_paginated(page, page_size, include_deleted)
 
@@ -0,0 +1,17 @@
+"""Tiny async stand-ins for tests that only care about return values."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+def areturn(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Async callable that ignores its arguments and returns ``value``.
+
+    Far cheaper than AsyncMock when the test never asserts on the call:
+    no call recording, no child-mock allocation per attribute access.
+    """
+
+    async def _stub(*args: Any, **kwargs: Any) -> Any:  # noqa: ARG001
+        return value
+
+    return _stub
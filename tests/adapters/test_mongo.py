@@ -1,9 +1,14 @@
+import re
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.infrastructure.persistence.adapters import MongoAdapter, MongoConfig
 from app.infrastructure.persistence.adapters.protocols import DatabaseType
+from tests._stubs import areturn
+
+# Compiled once; pytest.raises(match=...) accepts a pattern object.
+_NOT_CONNECTED = re.compile("Adapter not connected")
 
 
 class TestMongoConfig:
@@ -97,7 +102,7 @@ class TestMongoAdapter:
     def test_get_connection_raises_when_not_connected(
         self, adapter: MongoAdapter
     ) -> None:
-        with pytest.raises(RuntimeError, match="Adapter not connected"):
+        with pytest.raises(RuntimeError, match=_NOT_CONNECTED):
             adapter.get_connection()
 
     def test_collection(self, adapter: MongoAdapter) -> None:
@@ -154,9 +159,7 @@ class TestMongoAdapterWithMockedCollection:
     async def test_insert_one(
         self, adapter_with_mock: MongoAdapter, mock_collection: MagicMock
     ) -> None:
-        mock_result = MagicMock()
-        mock_result.inserted_id = "123"
-        mock_collection.insert_one.return_value = mock_result
+        mock_collection.insert_one = areturn(MagicMock(inserted_id="123"))
 
         collection = adapter_with_mock.collection("test")
         result = await collection.insert_one({"name": "new item"})
@@ -167,9 +170,7 @@ class TestMongoAdapterWithMockedCollection:
     async def test_update_one(
         self, adapter_with_mock: MongoAdapter, mock_collection: MagicMock
     ) -> None:
-        mock_result = MagicMock()
-        mock_result.modified_count = 1
-        mock_collection.update_one.return_value = mock_result
+        mock_collection.update_one = areturn(MagicMock(modified_count=1))
 
         collection = adapter_with_mock.collection("test")
         result = await collection.update_one(
@@ -182,9 +183,7 @@ class TestMongoAdapterWithMockedCollection:
     async def test_delete_one(
         self, adapter_with_mock: MongoAdapter, mock_collection: MagicMock
     ) -> None:
-        mock_result = MagicMock()
-        mock_result.deleted_count = 1
-        mock_collection.delete_one.return_value = mock_result
+        mock_collection.delete_one = areturn(MagicMock(deleted_count=1))
 
         collection = adapter_with_mock.collection("test")
         result = await collection.delete_one({"_id": "1"})
@@ -195,7 +194,7 @@ class TestMongoAdapterWithMockedCollection:
     async def test_count_documents(
         self, adapter_with_mock: MongoAdapter, mock_collection: MagicMock
     ) -> None:
-        mock_collection.count_documents.return_value = 42
+        mock_collection.count_documents = areturn(42)
 
         collection = adapter_with_mock.collection("test")
         result = await collection.count_documents({})
@@ -1,37 +1,97 @@
+import logging
 from collections.abc import AsyncIterator, Iterator
+from functools import partial
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
+import pytest_asyncio
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.infrastructure import AppException, Base
-from app.infrastructure.messaging.events import clear_handlers
+from app.infrastructure.core.context import _clear_sessions, _set_session
+from app.infrastructure.messaging.events import _handlers, clear_handlers
 from app.infrastructure.persistence.adapters import (
     SQLAlchemyAdapter,
     SQLConfig,
     get_registry,
-    reset_registry,
 )
 from app.infrastructure.web.exceptions import app_exception_handler
 from app.modules.todos.model import Todo  # noqa: F401
+from app.router import router as app_router
 from tests.factories import BaseFactory, TodoFactory
 
+# No test asserts on engine or pool logs; disabling the loggers skips the
+# isEnabledFor check SQLAlchemy makes on every statement.
+logging.getLogger("sqlalchemy.engine").disabled = True
+logging.getLogger("sqlalchemy.pool").disabled = True
 
+
+# Pinning a single backend also stops anyio from parametrizing every test
+# over (asyncio, trio); production only runs asyncio.
 @pytest.fixture(scope="session")
-def anyio_backend() -> str:
-    return "asyncio"
+def anyio_backend() -> str | tuple[str, dict[str, Any]]:
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "asyncio"
+    # uvloop cuts per-await scheduling overhead for every anyio test.
+    return ("asyncio", {"use_uvloop": True})
+
+
+# Snapshot/restore keeps the registry object alive and just swaps its
+# contents in place — cheaper than tearing the singleton down per test.
+def _snapshot_registry() -> tuple[dict[str, Any], dict[Any, Any]]:
+    registry = get_registry()
+    return dict(registry._adapters), dict(registry._defaults)
+
+
+def _restore_registry(snapshot: tuple[dict[str, Any], dict[Any, Any]]) -> None:
+    registry = get_registry()
+    registry._adapters.clear()
+    registry._adapters.update(snapshot[0])
+    registry._defaults.clear()
+    registry._defaults.update(snapshot[1])
+
+
+# Tests don't need durability: skipping fsync and the rollback journal
+# removes per-flush stalls on every write.
+def _enable_fast_sqlite_pragmas(engine: Any) -> None:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_conn: Any, _record: Any) -> None:
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
 
 
 @pytest.fixture(autouse=True)
 def cleanup_event_handlers() -> Iterator[None]:
     yield
-    clear_handlers()
-
-
-@pytest.fixture
-async def db_engine() -> AsyncIterator[Any]:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    # Fast path: most tests never register a handler.
+    if _handlers:
+        clear_handlers()
+
+
+# Session-scoped so the schema is created once instead of per test;
+# StaticPool keeps a single shared connection for the in-memory database.
+# The database name carries the pytest-xdist worker id so `-n auto` runs
+# get one independent database per worker process.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_engine(request: pytest.FixtureRequest) -> AsyncIterator[Any]:
+    worker = getattr(request.config, "workerinput", {}).get("workerid", "master")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///file:memdb_{worker}?mode=memory&cache=shared&uri=true",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False, "uri": True},
+    )
+    _enable_fast_sqlite_pragmas(engine)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -46,7 +106,9 @@ async def db_engine() -> AsyncIterator[Any]:
 
 @pytest.fixture
 async def db_adapter(db_engine: Any) -> AsyncIterator[SQLAlchemyAdapter]:
-    reset_registry()
+    snapshot = _snapshot_registry()
+    registry = get_registry()
+    registry.clear()
 
     config = SQLConfig(url="sqlite+aiosqlite:///:memory:")
     adapter = SQLAlchemyAdapter(config)
@@ -59,41 +121,50 @@ async def db_adapter(db_engine: Any) -> AsyncIterator[SQLAlchemyAdapter]:
     )
     adapter.configure_for_testing(db_engine, session_factory)
 
-    registry = get_registry()
     registry.register("primary", adapter, set_as_default=True)
 
     yield adapter
 
-    reset_registry()
+    _restore_registry(snapshot)
 
 
 @pytest.fixture
 async def db_session(db_adapter: SQLAlchemyAdapter) -> AsyncIterator[AsyncSession]:
-    from app.infrastructure.core.context import _clear_sessions, _set_session
-
-    async with (
-        db_adapter.engine.connect() as conn,
-        AsyncSession(bind=conn) as session,
-    ):
+    # SAVEPOINT-per-test: everything the test writes lands inside an outer
+    # transaction that is rolled back, so the shared schema never needs to
+    # be dropped and recreated between tests.
+    async with db_adapter.engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
         _set_session("primary", session)
-        yield session
-        _clear_sessions()
-
-
-@pytest.fixture
-async def client(db_session: AsyncSession) -> AsyncIterator[AsyncClient]:  # noqa: ARG001
-    from fastapi import FastAPI
+        try:
+            yield session
+        finally:
+            _clear_sessions()
+            await session.close()
+            await trans.rollback()
 
-    from app.router import router
 
+# Session-scoped: route compilation and dependency-graph construction are
+# paid once; per-test state lives in the db_session fixture, not the app.
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
     app = FastAPI()
     app.add_exception_handler(AppException, app_exception_handler)  # type: ignore[arg-type]
-    app.include_router(router)
+    app.include_router(app_router)
 
     @app.get("/health")
     async def health_check() -> dict[str, str]:
         return {"status": "healthy"}
 
+    return app
+
+
+# One AsyncClient for the whole session: httpx client construction (base
+# URL parsing, cookie jar, transport setup) is not paid per test. Per-test
+# state is carried by the context-var session binding, not the client.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client(app: FastAPI) -> AsyncIterator[AsyncClient]:
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
@@ -101,50 +172,29 @@ async def client(db_session: AsyncSession) -> AsyncIterator[AsyncClient]:  # noq
         yield client
 
 
-class BoundTodoFactory:
-    def __init__(self, session: AsyncSession) -> None:
-        self._session = session
-
-    def build(self, **kwargs: Any) -> Todo:
-        return TodoFactory.build(**kwargs)
-
-    async def create(self, **kwargs: Any) -> Todo:
-        return await TodoFactory.create(self._session, **kwargs)
-
-    async def create_batch(self, count: int, **kwargs: Any) -> list[Todo]:
-        return await TodoFactory.create_batch(self._session, count, **kwargs)
-
-
 @pytest.fixture
-def todo_factory(db_session: AsyncSession) -> BoundTodoFactory:
-    return BoundTodoFactory(db_session)
-
-
-class BoundFactory:
-    def __init__(
-        self, factory_class: type[BaseFactory[Any]], session: AsyncSession
-    ) -> None:
-        self._factory_class = factory_class
-        self._session = session
-
-    def build(self, **kwargs: Any) -> Any:
-        return self._factory_class.build(**kwargs)
-
-    async def create(self, **kwargs: Any) -> Any:
-        return await self._factory_class.create(self._session, **kwargs)
-
-    async def create_batch(self, count: int, **kwargs: Any) -> list[Any]:
-        return await self._factory_class.create_batch(self._session, count, **kwargs)
-
+def client(http_client: AsyncClient, db_session: AsyncSession) -> AsyncClient:  # noqa: ARG001
+    return http_client
+
+
+# functools.partial binds the session without the extra Python frame and
+# per-test wrapper-object allocation the old Bound* classes added.
+def _bind_factory(
+    factory_class: type[BaseFactory[Any]], session: AsyncSession
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        build=factory_class.build,
+        build_batch=factory_class.build_batch,
+        create=partial(factory_class.create, session),
+        create_batch=partial(factory_class.create_batch, session),
+    )
 
-class FactoryManager:
-    def __init__(self, session: AsyncSession) -> None:
-        self._session = session
 
-    def get(self, factory_class: type[BaseFactory[Any]]) -> BoundFactory:
-        return BoundFactory(factory_class, self._session)
+@pytest.fixture
+def todo_factory(db_session: AsyncSession) -> SimpleNamespace:
+    return _bind_factory(TodoFactory, db_session)
 
 
 @pytest.fixture
-def factory(db_session: AsyncSession) -> FactoryManager:
-    return FactoryManager(db_session)
+def factory(db_session: AsyncSession) -> SimpleNamespace:
+    return SimpleNamespace(get=partial(_bind_factory, session=db_session))
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Container
 from datetime import UTC, datetime
-from typing import Any, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,38 +12,74 @@ from app.modules.todos.model import Todo
 
 ModelT = TypeVar("ModelT", bound=Base)
 
+# Bound once at import; skips the module-attribute lookup on every call.
+_now = datetime.now
+
 
 class BaseFactory(Generic[ModelT]):
     model: type[ModelT]
     defaults: dict[str, Any] = {}
 
+    # Which timestamp/soft-delete columns the model has, resolved once at
+    # class-definition time instead of via hasattr on every build.
+    _has_created_at: ClassVar[bool] = False
+    _has_updated_at: ClassVar[bool] = False
+    _has_is_deleted: ClassVar[bool] = False
+    _has_deleted_at: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        model = getattr(cls, "model", None)
+        if model is not None:
+            cls._has_created_at = hasattr(model, "created_at")
+            cls._has_updated_at = hasattr(model, "updated_at")
+            cls._has_is_deleted = hasattr(model, "is_deleted")
+            cls._has_deleted_at = hasattr(model, "deleted_at")
+
     @classmethod
     def _generate_id(cls) -> str:
+        # Hyphenated canonical form; TodoId validation rejects bare hex.
         return str(uuid4())
 
     @classmethod
-    def _get_defaults(cls) -> dict[str, Any]:
-        defaults: dict[str, Any] = {"id": cls._generate_id()}
-
-        if hasattr(cls.model, "created_at"):
-            defaults["created_at"] = datetime.now(UTC)
-        if hasattr(cls.model, "updated_at"):
-            defaults["updated_at"] = datetime.now(UTC)
-        if hasattr(cls.model, "is_deleted"):
+    def _get_defaults(
+        cls, skip: Container[str] = (), now: datetime | None = None
+    ) -> dict[str, Any]:
+        # Defaults already supplied via overrides are skipped, so no uuid or
+        # clock call is wasted on values that would be thrown away.
+        defaults: dict[str, Any] = {}
+        if "id" not in skip:
+            defaults["id"] = cls._generate_id()
+
+        need_created = cls._has_created_at and "created_at" not in skip
+        need_updated = cls._has_updated_at and "updated_at" not in skip
+        if need_created or need_updated:
+            stamp = now if now is not None else _now(UTC)
+            if need_created:
+                defaults["created_at"] = stamp
+            if need_updated:
+                defaults["updated_at"] = stamp
+        if cls._has_is_deleted and "is_deleted" not in skip:
             defaults["is_deleted"] = False
-        if hasattr(cls.model, "deleted_at"):
+        if cls._has_deleted_at and "deleted_at" not in skip:
             defaults["deleted_at"] = None
 
         return {**defaults, **cls.defaults}
 
     @classmethod
     def build(cls, **overrides: Any) -> ModelT:
-        data = {**cls._get_defaults(), **overrides}
+        data = {**cls._get_defaults(skip=overrides.keys()), **overrides}
         return cls.model(**data)
 
     @classmethod
     def build_batch(cls, count: int, **overrides: Any) -> list[ModelT]:
-        return [cls.build(**overrides) for _ in range(count)]
+        # One clock read for the whole batch.
+        now = _now(UTC)
+        skip = overrides.keys()
+        return [
+            cls.model(**{**cls._get_defaults(skip=skip, now=now), **overrides})
+            for _ in range(count)
+        ]
 
     @classmethod
     async def create(cls, session: AsyncSession, **overrides: Any) -> ModelT:
@@ -56,10 +93,11 @@ class BaseFactory(Generic[ModelT]):
     async def create_batch(
         cls, session: AsyncSession, count: int, **overrides: Any
     ) -> list[ModelT]:
-        instances = []
-        for _ in range(count):
-            instance = await cls.create(session, **overrides)
-            instances.append(instance)
+        # Single flush for the whole batch; factory-generated ids and
+        # timestamps are already populated client-side, so no refresh needed.
+        instances = cls.build_batch(count, **overrides)
+        session.add_all(instances)
+        await session.flush()
         return instances
 
 
@@ -0,0 +1,146 @@
+"""In-process dict-backed stand-in for the async Redis client.
+
+Covers only the commands BaseKeyValueRepository issues. Unlike fakeredis it
+does no command dispatch or RESP-style parsing, so each call is a plain
+dict operation — protocol conformance stays covered by the fakeredis-based
+adapter tests in tests/adapters/test_redis.py.
+"""
+
+import math
+import time
+from fnmatch import fnmatchcase
+from typing import Any
+
+
+class DictRedis:
+    def __init__(self) -> None:
+        self._data: dict[str, str] = {}
+        self._hashes: dict[str, dict[str, str]] = {}
+        self._deadlines: dict[str, float] = {}
+
+    def _evict_if_expired(self, key: str) -> None:
+        deadline = self._deadlines.get(key)
+        if deadline is not None and time.monotonic() >= deadline:
+            self._data.pop(key, None)
+            self._hashes.pop(key, None)
+            del self._deadlines[key]
+
+    async def get(self, key: str) -> str | None:
+        self._evict_if_expired(key)
+        return self._data.get(key)
+
+    async def set(self, key: str, value: str) -> bool:
+        self._data[key] = value
+        self._deadlines.pop(key, None)
+        return True
+
+    async def setex(self, key: str, ttl: int, value: str) -> bool:
+        self._data[key] = value
+        self._deadlines[key] = time.monotonic() + ttl
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        count = 0
+        for key in keys:
+            self._evict_if_expired(key)
+            removed = self._data.pop(key, None) is not None
+            removed = self._hashes.pop(key, None) is not None or removed
+            if removed:
+                self._deadlines.pop(key, None)
+                count += 1
+        return count
+
+    async def exists(self, *keys: str) -> int:
+        count = 0
+        for key in keys:
+            self._evict_if_expired(key)
+            if key in self._data or key in self._hashes:
+                count += 1
+        return count
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [await self.get(key) for key in keys]
+
+    async def keys(self, pattern: str = "*") -> list[str]:
+        for key in list(self._deadlines):
+            self._evict_if_expired(key)
+        return [key for key in [*self._data, *self._hashes] if fnmatchcase(key, pattern)]
+
+    async def ttl(self, key: str) -> int:
+        self._evict_if_expired(key)
+        if key not in self._data and key not in self._hashes:
+            return -2
+        deadline = self._deadlines.get(key)
+        if deadline is None:
+            return -1
+        return max(1, math.ceil(deadline - time.monotonic()))
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        self._evict_if_expired(key)
+        if key not in self._data and key not in self._hashes:
+            return False
+        self._deadlines[key] = time.monotonic() + seconds
+        return True
+
+    async def hget(self, key: str, field: str) -> str | None:
+        self._evict_if_expired(key)
+        return self._hashes.get(key, {}).get(field)
+
+    async def hset(
+        self,
+        key: str,
+        field: str | None = None,
+        value: str | None = None,
+        mapping: dict[str, str] | None = None,
+    ) -> int:
+        self._evict_if_expired(key)
+        fields = self._hashes.setdefault(key, {})
+        items = dict(mapping) if mapping else {}
+        if field is not None and value is not None:
+            items[field] = value
+        added = sum(1 for f in items if f not in fields)
+        fields.update(items)
+        return added
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        self._evict_if_expired(key)
+        return dict(self._hashes.get(key, {}))
+
+    async def hdel(self, key: str, *fields: str) -> int:
+        self._evict_if_expired(key)
+        stored = self._hashes.get(key, {})
+        count = 0
+        for field in fields:
+            if stored.pop(field, None) is not None:
+                count += 1
+        return count
+
+    async def hexists(self, key: str, field: str) -> bool:
+        self._evict_if_expired(key)
+        return field in self._hashes.get(key, {})
+
+    def pipeline(self) -> "DictRedisPipeline":
+        return DictRedisPipeline(self)
+
+    async def flushall(self) -> bool:
+        self._data.clear()
+        self._hashes.clear()
+        self._deadlines.clear()
+        return True
+
+
+class DictRedisPipeline:
+    def __init__(self, client: DictRedis) -> None:
+        self._client = client
+        self._queue: list[tuple[str, tuple[Any, ...]]] = []
+
+    def set(self, key: str, value: str) -> "DictRedisPipeline":
+        self._queue.append(("set", (key, value)))
+        return self
+
+    def setex(self, key: str, ttl: int, value: str) -> "DictRedisPipeline":
+        self._queue.append(("setex", (key, ttl, value)))
+        return self
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self._client, command)(*args) for command, args in self._queue]
@@ -1,6 +1,7 @@
-from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from operator import methodcaller
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
@@ -8,22 +9,52 @@ from app.infrastructure.persistence.adapters import (
     MongoAdapter,
     MongoConfig,
     get_registry,
-    reset_registry,
 )
 from app.infrastructure.persistence.repository import BaseDocumentRepository
+from tests.conftest import _restore_registry, _snapshot_registry
 
+# Subscripting the generic base runs Generic.__class_getitem__ each time;
+# evaluate it once and let every subclass share the parametrized alias.
+_DictDocRepo = BaseDocumentRepository[dict[str, Any]]
 
-class ProfileRepository(BaseDocumentRepository[dict[str, Any]]):
+
+class ProfileRepository(_DictDocRepo):
     collection_name = "profiles"
 
 
-class EventRepository(BaseDocumentRepository[dict[str, Any]]):
+class EventRepository(_DictDocRepo):
+    collection_name = "events"
+
+
+class UserRepository(_DictDocRepo):
+    collection_name = "users"
+
+    async def find_by_email(self, email: str) -> dict[str, Any] | None:
+        return await self.find_one({"email": email})
+
+    async def find_active_users(self, limit: int = 100) -> list[dict[str, Any]]:
+        return await self.find_many(
+            {"status": "active"},
+            sort=[("last_login", -1)],
+            limit=limit,
+        )
+
+    async def deactivate_users(self, user_ids: list[str]) -> int:
+        return await self.update_many(
+            {"_id": {"$in": user_ids}},
+            {"status": "inactive"},
+        )
+
+
+class AnalyticsRepository(_DictDocRepo):
     collection_name = "events"
+    adapter_name = "analytics_db"
 
 
-@pytest.fixture
-def mock_collection() -> MagicMock:
-    collection = MagicMock()
+def _build_collection_mock() -> Mock:
+    # Plain Mock: nothing here uses magic-method protocols, and MagicMock
+    # installs its dunder children eagerly at construction.
+    collection = Mock()
     collection.find_one = AsyncMock()
     collection.find = MagicMock()
     collection.insert_one = AsyncMock()
@@ -39,155 +70,227 @@ def mock_collection() -> MagicMock:
     return collection
 
 
-@pytest.fixture
-def mock_cursor() -> MagicMock:
-    cursor = MagicMock()
-    cursor.sort = MagicMock(return_value=cursor)
-    cursor.skip = MagicMock(return_value=cursor)
-    cursor.limit = MagicMock(return_value=cursor)
-    cursor.to_list = AsyncMock()
-    return cursor
+def _build_mock_database(mock_collection: Mock) -> MagicMock:
+    # MagicMock stays here: collection lookup goes through __getitem__.
+    database = MagicMock()
+    database.__getitem__ = MagicMock(return_value=mock_collection)
+    return database
 
 
-@pytest.fixture
-async def mongo_adapter(
-    mock_collection: MagicMock,
-) -> AsyncIterator[MongoAdapter]:
-    reset_registry()
-    adapter = MongoAdapter(
-        MongoConfig(url="mongodb://localhost:27017", database="test")
-    )
-    mock_database = MagicMock()
-    mock_database.__getitem__ = MagicMock(return_value=mock_collection)
-    adapter._database = mock_database
-    adapter._client = MagicMock()
+def _build_adapter(mock_collection: Mock, database: str) -> MongoAdapter:
+    adapter = MongoAdapter(MongoConfig(url="mongodb://localhost:27017", database=database))
+    adapter._database = _build_mock_database(mock_collection)
+    adapter._client = Mock()
+    return adapter
 
-    registry = get_registry()
-    registry.register("mongo", adapter, set_as_default=True)
 
-    yield adapter
-    reset_registry()
-
-
-@pytest.fixture
-def profile_repo(mongo_adapter: MongoAdapter) -> ProfileRepository:  # noqa: ARG001
-    return ProfileRepository()
+_AGG_PIPELINE: list[dict[str, Any]] = [
+    {"$group": {"_id": "$country", "count": {"$sum": 1}}},
+    {"$sort": {"count": -1}},
+]
 
 
-class TestBaseDocumentRepository:
-    @pytest.mark.anyio
-    async def test_find_by_id(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-    ) -> None:
-        mock_collection.find_one.return_value = {"_id": "123", "name": "John"}
-
-        result = await profile_repo.find_by_id("123")
-
-        assert result == {"_id": "123", "name": "John"}
-        mock_collection.find_one.assert_called_once_with({"_id": "123"})
-
-    @pytest.mark.anyio
-    async def test_find_by_id_not_found(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-    ) -> None:
-        mock_collection.find_one.return_value = None
+def _build_cursor_mock() -> Mock:
+    cursor = Mock()
+    cursor.sort = Mock(return_value=cursor)
+    cursor.skip = Mock(return_value=cursor)
+    cursor.limit = Mock(return_value=cursor)
+    cursor.to_list = AsyncMock()
+    return cursor
 
-        result = await profile_repo.find_by_id("nonexistent")
 
-        assert result is None
+# The mock skeletons are built once per session — wiring ~13 AsyncMock
+# attributes is the expensive part — and reset between tests instead.
+@pytest.fixture(scope="session")
+def mock_collection() -> Mock:
+    return _build_collection_mock()
 
-    @pytest.mark.anyio
-    async def test_find_one(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-    ) -> None:
-        mock_collection.find_one.return_value = {"_id": "1", "email": "john@test.com"}
 
-        result = await profile_repo.find_one({"email": "john@test.com"})
+@pytest.fixture(scope="session")
+def mock_cursor() -> Mock:
+    return _build_cursor_mock()
 
-        assert result == {"_id": "1", "email": "john@test.com"}
-        mock_collection.find_one.assert_called_with({"email": "john@test.com"})
 
-    @pytest.mark.anyio
-    async def test_find_many(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-        mock_cursor: MagicMock,
-    ) -> None:
-        mock_collection.find.return_value = mock_cursor
-        mock_cursor.to_list.return_value = [
-            {"_id": "1", "name": "John"},
-            {"_id": "2", "name": "Jane"},
-        ]
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_collection: Mock, mock_cursor: Mock) -> None:
+    mock_collection.reset_mock(return_value=True, side_effect=True)
+    mock_cursor.reset_mock(return_value=True, side_effect=True)
+    # reset_mock clears the chained return values; restore them.
+    mock_cursor.sort.return_value = mock_cursor
+    mock_cursor.skip.return_value = mock_cursor
+    mock_cursor.limit.return_value = mock_cursor
 
-        result = await profile_repo.find_many({"active": True}, skip=0, limit=10)
 
-        assert len(result) == 2
-        mock_collection.find.assert_called_once_with({"active": True})
-        mock_cursor.skip.assert_called_once_with(0)
-        mock_cursor.limit.assert_called_once_with(10)
-
-    @pytest.mark.anyio
-    async def test_find_many_with_sort(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-        mock_cursor: MagicMock,
-    ) -> None:
-        mock_collection.find.return_value = mock_cursor
-        mock_cursor.to_list.return_value = []
+# Module-scoped: the adapter is stateless across these tests (all calls go
+# through the per-test-reset mocks), so one registration covers the module.
+@pytest.fixture(scope="module")
+def mongo_adapter(mock_collection: Mock) -> Iterator[MongoAdapter]:
+    snapshot = _snapshot_registry()
+    registry = get_registry()
+    registry.clear()
 
-        await profile_repo.find_many(
-            filter=None,
-            sort=[("created_at", -1)],
-        )
+    adapter = _build_adapter(mock_collection, "test")
+    registry.register("mongo", adapter, set_as_default=True)
 
-        mock_cursor.sort.assert_called_once_with([("created_at", -1)])
+    yield adapter
+    _restore_registry(snapshot)
 
-    @pytest.mark.anyio
-    async def test_count_documents(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-    ) -> None:
-        mock_collection.count_documents.return_value = 42
 
-        result = await profile_repo.count_documents({"status": "active"})
+# Module-scoped: the repository is stateless apart from its cached adapter
+# reference, so one instance (and one registry lookup) serves every test.
+@pytest.fixture(scope="module")
+def profile_repo(mongo_adapter: MongoAdapter) -> ProfileRepository:  # noqa: ARG001
+    return ProfileRepository()
 
-        assert result == 42
-        mock_collection.count_documents.assert_called_once_with({"status": "active"})
 
+class TestBaseDocumentRepository:
+    # The simple read paths share one shape — wire a mock return value,
+    # await a repository call, check result and recorded call — so they run
+    # as one parametrized test instead of six function definitions.
     @pytest.mark.anyio
-    async def test_count_documents_no_filter(
+    @pytest.mark.parametrize(
+        ("call", "mock_attr", "return_value", "expected", "expected_args"),
+        [
+            pytest.param(
+                methodcaller("find_by_id", "123"),
+                "find_one",
+                {"_id": "123", "name": "John"},
+                {"_id": "123", "name": "John"},
+                ({"_id": "123"},),
+                id="find_by_id",
+            ),
+            pytest.param(
+                methodcaller("find_by_id", "nonexistent"),
+                "find_one",
+                None,
+                None,
+                ({"_id": "nonexistent"},),
+                id="find_by_id_not_found",
+            ),
+            pytest.param(
+                methodcaller("find_one", {"email": "john@test.com"}),
+                "find_one",
+                {"_id": "1", "email": "john@test.com"},
+                {"_id": "1", "email": "john@test.com"},
+                ({"email": "john@test.com"},),
+                id="find_one",
+            ),
+            pytest.param(
+                methodcaller("count_documents", {"status": "active"}),
+                "count_documents",
+                42,
+                42,
+                ({"status": "active"},),
+                id="count_documents",
+            ),
+            pytest.param(
+                methodcaller("count_documents"),
+                "count_documents",
+                100,
+                100,
+                ({},),
+                id="count_documents_no_filter",
+            ),
+            pytest.param(
+                methodcaller("distinct", "country", {"active": True}),
+                "distinct",
+                ["US", "UK", "CA"],
+                ["US", "UK", "CA"],
+                ("country", {"active": True}),
+                id="distinct",
+            ),
+        ],
+    )
+    async def test_simple_read(
         self,
         profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
+        mock_collection: Mock,
+        call: Any,
+        mock_attr: str,
+        return_value: Any,
+        expected: Any,
+        expected_args: tuple[Any, ...],
     ) -> None:
-        mock_collection.count_documents.return_value = 100
+        mock = getattr(mock_collection, mock_attr)
+        mock.return_value = return_value
 
-        result = await profile_repo.count_documents()
+        result = await call(profile_repo)
 
-        assert result == 100
-        mock_collection.count_documents.assert_called_once_with({})
+        assert result == expected
+        mock.assert_called_once_with(*expected_args)
 
+    # Cursor-returning operations share one shape too: wire the shared
+    # cursor behind a collection method, set to_list, await, check the
+    # recorded calls. One parametrized test replaces four cursor setups.
     @pytest.mark.anyio
-    async def test_distinct(
+    @pytest.mark.parametrize(
+        ("call", "cursor_attr", "to_list_result", "result_mocks", "expected_len", "expected_calls"),
+        [
+            pytest.param(
+                methodcaller("find_many", {"active": True}, skip=0, limit=10),
+                "find",
+                [{"_id": "1", "name": "John"}, {"_id": "2", "name": "Jane"}],
+                {},
+                2,
+                [
+                    ("find", ({"active": True},)),
+                    ("cursor.skip", (0,)),
+                    ("cursor.limit", (10,)),
+                ],
+                id="find_many",
+            ),
+            pytest.param(
+                methodcaller("find_many", filter=None, sort=[("created_at", -1)]),
+                "find",
+                [],
+                {},
+                0,
+                [("cursor.sort", ([("created_at", -1)],))],
+                id="find_many_with_sort",
+            ),
+            pytest.param(
+                methodcaller("insert_many", [{"name": f"Profile {i}"} for i in range(3)]),
+                "find",
+                [{"_id": "id1"}, {"_id": "id2"}, {"_id": "id3"}],
+                {"insert_many": {"inserted_ids": ["id1", "id2", "id3"]}},
+                3,
+                [("insert_many", ([{"name": f"Profile {i}"} for i in range(3)],))],
+                id="insert_many",
+            ),
+            pytest.param(
+                methodcaller("aggregate", _AGG_PIPELINE),
+                "aggregate",
+                [{"_id": "US", "count": 100}, {"_id": "UK", "count": 50}],
+                {},
+                2,
+                [("aggregate", (_AGG_PIPELINE,))],
+                id="aggregate",
+            ),
+        ],
+    )
+    async def test_cursor_operation(
         self,
         profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
+        mock_collection: Mock,
+        mock_cursor: Mock,
+        call: Any,
+        cursor_attr: str,
+        to_list_result: list[dict[str, Any]],
+        result_mocks: dict[str, dict[str, Any]],
+        expected_len: int,
+        expected_calls: list[tuple[str, tuple[Any, ...]]],
     ) -> None:
-        mock_collection.distinct.return_value = ["US", "UK", "CA"]
+        getattr(mock_collection, cursor_attr).return_value = mock_cursor
+        mock_cursor.to_list.return_value = to_list_result
+        for attr, result_attrs in result_mocks.items():
+            getattr(mock_collection, attr).return_value = Mock(**result_attrs)
 
-        result = await profile_repo.distinct("country", {"active": True})
+        result = await call(profile_repo)
 
-        assert result == ["US", "UK", "CA"]
-        mock_collection.distinct.assert_called_once_with("country", {"active": True})
+        assert len(result) == expected_len
+        for path, args in expected_calls:
+            target = mock_cursor if path.startswith("cursor.") else mock_collection
+            getattr(target, path.removeprefix("cursor.")).assert_called_once_with(*args)
 
 
 class TestDocumentWriteOperations:
@@ -195,9 +298,9 @@ class TestDocumentWriteOperations:
     async def test_insert_one(
         self,
         profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
+        mock_collection: Mock,
     ) -> None:
-        mock_result = MagicMock()
+        mock_result = Mock()
         mock_result.inserted_id = "new_id"
         mock_collection.insert_one.return_value = mock_result
         mock_collection.find_one.return_value = {
@@ -210,34 +313,11 @@ class TestDocumentWriteOperations:
         assert result["_id"] == "new_id"
         mock_collection.insert_one.assert_called_once()
 
-    @pytest.mark.anyio
-    async def test_insert_many(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-        mock_cursor: MagicMock,
-    ) -> None:
-        mock_result = MagicMock()
-        mock_result.inserted_ids = ["id1", "id2", "id3"]
-        mock_collection.insert_many.return_value = mock_result
-        mock_collection.find.return_value = mock_cursor
-        mock_cursor.to_list.return_value = [
-            {"_id": "id1"},
-            {"_id": "id2"},
-            {"_id": "id3"},
-        ]
-
-        docs = [{"name": f"Profile {i}"} for i in range(3)]
-        result = await profile_repo.insert_many(docs)
-
-        assert len(result) == 3
-        mock_collection.insert_many.assert_called_once_with(docs)
-
     @pytest.mark.anyio
     async def test_insert_many_empty(
         self,
         profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
+        mock_collection: Mock,
     ) -> None:
         result = await profile_repo.insert_many([])
 
@@ -245,111 +325,95 @@ class TestDocumentWriteOperations:
         mock_collection.insert_many.assert_not_called()
 
     @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("filter_", "upsert"),
+        [
+            pytest.param({"_id": "1"}, False, id="update"),
+            pytest.param({"external_id": "ext123"}, True, id="upsert"),
+        ],
+    )
     async def test_update_one(
         self,
         profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
+        mock_collection: Mock,
+        filter_: dict[str, Any],
+        upsert: bool,
     ) -> None:
         mock_collection.find_one.return_value = {"_id": "1", "name": "Updated"}
 
-        result = await profile_repo.update_one(
-            {"_id": "1"},
-            {"name": "Updated"},
-        )
+        result = await profile_repo.update_one(filter_, {"name": "Updated"}, upsert=upsert)
 
         assert result is not None
         assert result["name"] == "Updated"
         mock_collection.update_one.assert_called_once_with(
-            {"_id": "1"},
+            filter_,
             {"$set": {"name": "Updated"}},
-            upsert=False,
+            upsert=upsert,
         )
 
+    # Count-returning writes share one shape: wire a result object, await
+    # the repository call, compare the count/flag.
     @pytest.mark.anyio
-    async def test_update_one_with_upsert(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-    ) -> None:
-        mock_collection.find_one.return_value = {"_id": "1", "name": "Upserted"}
-
-        await profile_repo.update_one(
-            {"external_id": "ext123"},
-            {"name": "Upserted"},
-            upsert=True,
-        )
-
-        mock_collection.update_one.assert_called_once_with(
-            {"external_id": "ext123"},
-            {"$set": {"name": "Upserted"}},
-            upsert=True,
-        )
-
-    @pytest.mark.anyio
-    async def test_update_many(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-    ) -> None:
-        mock_result = MagicMock()
-        mock_result.modified_count = 5
-        mock_collection.update_many.return_value = mock_result
-
-        count = await profile_repo.update_many(
-            {"status": "pending"},
-            {"status": "processed"},
-        )
-
-        assert count == 5
-
-    @pytest.mark.anyio
-    async def test_delete_one(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-    ) -> None:
-        mock_result = MagicMock()
-        mock_result.deleted_count = 1
-        mock_collection.delete_one.return_value = mock_result
-
-        result = await profile_repo.delete_one({"_id": "123"})
-
-        assert result is True
-        mock_collection.delete_one.assert_called_once_with({"_id": "123"})
-
-    @pytest.mark.anyio
-    async def test_delete_one_not_found(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-    ) -> None:
-        mock_result = MagicMock()
-        mock_result.deleted_count = 0
-        mock_collection.delete_one.return_value = mock_result
-
-        result = await profile_repo.delete_one({"_id": "nonexistent"})
-
-        assert result is False
-
-    @pytest.mark.anyio
-    async def test_delete_many(
+    @pytest.mark.parametrize(
+        ("call", "mock_attr", "result_attr", "result_value", "expected"),
+        [
+            pytest.param(
+                methodcaller("update_many", {"status": "pending"}, {"status": "processed"}),
+                "update_many",
+                "modified_count",
+                5,
+                5,
+                id="update_many",
+            ),
+            pytest.param(
+                methodcaller("delete_one", {"_id": "123"}),
+                "delete_one",
+                "deleted_count",
+                1,
+                True,
+                id="delete_one",
+            ),
+            pytest.param(
+                methodcaller("delete_one", {"_id": "nonexistent"}),
+                "delete_one",
+                "deleted_count",
+                0,
+                False,
+                id="delete_one_not_found",
+            ),
+            pytest.param(
+                methodcaller("delete_many", {"expired": True}),
+                "delete_many",
+                "deleted_count",
+                10,
+                10,
+                id="delete_many",
+            ),
+        ],
+    )
+    async def test_simple_write(
         self,
         profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
+        mock_collection: Mock,
+        call: Any,
+        mock_attr: str,
+        result_attr: str,
+        result_value: int,
+        expected: Any,
     ) -> None:
-        mock_result = MagicMock()
-        mock_result.deleted_count = 10
-        mock_collection.delete_many.return_value = mock_result
+        mock = getattr(mock_collection, mock_attr)
+        mock.return_value = Mock(**{result_attr: result_value})
 
-        count = await profile_repo.delete_many({"expired": True})
+        result = await call(profile_repo)
 
-        assert count == 10
+        assert result == expected
+        mock.assert_called_once()
 
     @pytest.mark.anyio
     async def test_replace_one(
         self,
         profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
+        mock_collection: Mock,
     ) -> None:
         replacement = {"_id": "1", "name": "Replaced", "version": 2}
         mock_collection.find_one.return_value = replacement
@@ -367,64 +431,14 @@ class TestDocumentWriteOperations:
         )
 
 
-class TestDocumentAggregation:
-    @pytest.mark.anyio
-    async def test_aggregate(
-        self,
-        profile_repo: ProfileRepository,
-        mock_collection: MagicMock,
-    ) -> None:
-        mock_cursor = MagicMock()
-        mock_cursor.to_list = AsyncMock(
-            return_value=[
-                {"_id": "US", "count": 100},
-                {"_id": "UK", "count": 50},
-            ]
-        )
-        mock_collection.aggregate.return_value = mock_cursor
-
-        pipeline: list[dict[str, Any]] = [
-            {"$group": {"_id": "$country", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-        ]
-        result = await profile_repo.aggregate(pipeline)
-
-        assert len(result) == 2
-        assert result[0]["count"] == 100
-        mock_collection.aggregate.assert_called_once_with(pipeline)
-
-
 class TestCustomDocumentRepository:
     @pytest.mark.anyio
     async def test_custom_repository_methods(
         self,
         mongo_adapter: MongoAdapter,  # noqa: ARG002
-        mock_collection: MagicMock,
-        mock_cursor: MagicMock,  # noqa: ARG002
+        mock_collection: Mock,
+        mock_cursor: Mock,  # noqa: ARG002
     ) -> None:
-        class UserRepository(BaseDocumentRepository[dict[str, Any]]):
-            collection_name = "users"
-
-            async def find_by_email(self, email: str) -> dict[str, Any] | None:
-                return await self.find_one({"email": email})
-
-            async def find_active_users(
-                self, limit: int = 100
-            ) -> list[dict[str, Any]]:
-                return await self.find_many(
-                    {"status": "active"},
-                    sort=[("last_login", -1)],
-                    limit=limit,
-                )
-
-            async def deactivate_users(
-                self, user_ids: list[str]
-            ) -> int:
-                return await self.update_many(
-                    {"_id": {"$in": user_ids}},
-                    {"status": "inactive"},
-                )
-
         mock_collection.find_one.return_value = {
             "_id": "1",
             "email": "test@example.com",
@@ -441,31 +455,19 @@ class TestRepositoryWithDifferentAdapters:
     @pytest.mark.anyio
     async def test_named_adapter(
         self,
-        mock_collection: MagicMock,
+        mock_collection: Mock,
     ) -> None:
-        reset_registry()
-
-        class AnalyticsRepository(BaseDocumentRepository[dict[str, Any]]):
-            collection_name = "events"
-            adapter_name = "analytics_db"
-
-        adapter = MongoAdapter(
-            MongoConfig(url="mongodb://localhost:27017", database="analytics")
-        )
-        mock_database = MagicMock()
-        mock_database.__getitem__ = MagicMock(return_value=mock_collection)
-        adapter._database = mock_database
-        adapter._client = MagicMock()
-
+        snapshot = _snapshot_registry()
         registry = get_registry()
-        registry.register("analytics_db", adapter)
-
-        mock_collection.find_one.return_value = {"_id": "event1", "type": "click"}
-
-        repo = AnalyticsRepository()
-        event = await repo.find_by_id("event1")
-
-        assert event is not None
-        assert event["type"] == "click"
-
-        reset_registry()
+        registry.clear()
+        try:
+            registry.register("analytics_db", _build_adapter(mock_collection, "analytics"))
+            mock_collection.find_one.return_value = {"_id": "event1", "type": "click"}
+
+            repo = AnalyticsRepository()
+            event = await repo.find_by_id("event1")
+
+            assert event is not None
+            assert event["type"] == "click"
+        finally:
+            _restore_registry(snapshot)
@@ -1,4 +1,4 @@
-from collections.abc import AsyncIterator
+from collections.abc import Iterator
 from typing import Any
 
 import pytest
@@ -7,47 +7,89 @@ from app.infrastructure.persistence.adapters import (
     RedisAdapter,
     RedisConfig,
     get_registry,
-    reset_registry,
 )
 from app.infrastructure.persistence.repository import BaseKeyValueRepository
+from tests.conftest import _restore_registry, _snapshot_registry
+from tests.repositories._fake_redis import DictRedis
 
+# Subscripting the generic base runs Generic.__class_getitem__ each time;
+# evaluate it once and let every subclass share the parametrized alias.
+_DictKVRepo = BaseKeyValueRepository[dict[str, Any]]
 
-class CacheRepository(BaseKeyValueRepository[dict[str, Any]]):
+
+class CacheRepository(_DictKVRepo):
     key_prefix = "cache"
 
 
-class SessionRepository(BaseKeyValueRepository[dict[str, Any]]):
+class SessionRepository(_DictKVRepo):
     key_prefix = "session"
 
 
-@pytest.fixture
-async def redis_client() -> AsyncIterator[Any]:
-    import fakeredis.aioredis
+class UserSession(_DictKVRepo):
+    key_prefix = "user_session"
 
-    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
-    yield client
-    await client.flushall()
-    await client.aclose()
+    async def create_session(self, user_id: str, data: dict[str, Any], ttl: int = 3600) -> bool:
+        return await self.set(f"user:{user_id}", data, ttl=ttl)
 
+    async def get_session(self, user_id: str) -> dict[str, Any] | None:
+        return await self.get(f"user:{user_id}")
 
-@pytest.fixture
-async def redis_adapter(redis_client: Any) -> AsyncIterator[RedisAdapter]:
-    reset_registry()
-    adapter = RedisAdapter(RedisConfig(url="redis://localhost:6379/0"))
-    adapter._client = redis_client
+    async def invalidate_session(self, user_id: str) -> bool:
+        return await self.delete(f"user:{user_id}")
+
+
+# Registry registration is module-scoped; per test the adapter just gets a
+# fresh DictRedis — a plain dict-backed fake whose construction and calls
+# cost nanoseconds, unlike fakeredis' command dispatch. Redis protocol
+# conformance stays covered by tests/adapters/test_redis.py.
+@pytest.fixture(scope="module")
+def _registered_redis_adapter() -> Iterator[RedisAdapter]:
+    snapshot = _snapshot_registry()
     registry = get_registry()
+    registry.clear()
+    adapter = RedisAdapter(RedisConfig(url="redis://localhost:6379/0"))
     registry.register("redis", adapter, set_as_default=True)
     yield adapter
-    reset_registry()
+    _restore_registry(snapshot)
 
 
 @pytest.fixture
-def cache_repo(redis_adapter: RedisAdapter) -> CacheRepository:  # noqa: ARG001
+def redis_client() -> DictRedis:
+    return DictRedis()
+
+
+@pytest.fixture
+def redis_adapter(_registered_redis_adapter: RedisAdapter, redis_client: Any) -> RedisAdapter:
+    _registered_redis_adapter._client = redis_client
+    return _registered_redis_adapter
+
+
+# Repositories are stateless apart from the cached adapter reference, so a
+# single instance per module serves every test; the per-test redis_adapter
+# dependency still swaps in a fresh DictRedis underneath it.
+@pytest.fixture
+def cache_repo(
+    redis_adapter: RedisAdapter,  # noqa: ARG001
+    _cache_repo: CacheRepository,
+) -> CacheRepository:
+    return _cache_repo
+
+
+@pytest.fixture(scope="module")
+def _cache_repo() -> CacheRepository:
     return CacheRepository()
 
 
 @pytest.fixture
-def session_repo(redis_adapter: RedisAdapter) -> SessionRepository:  # noqa: ARG001
+def session_repo(
+    redis_adapter: RedisAdapter,  # noqa: ARG001
+    _session_repo: SessionRepository,
+) -> SessionRepository:
+    return _session_repo
+
+
+@pytest.fixture(scope="module")
+def _session_repo() -> SessionRepository:
     return SessionRepository()
 
 
@@ -107,9 +149,7 @@ class TestBaseKeyValueRepository:
 class TestBulkOperations:
     @pytest.mark.anyio
     async def test_get_many(self, cache_repo: CacheRepository) -> None:
-        await cache_repo.set("item1", {"id": 1})
-        await cache_repo.set("item2", {"id": 2})
-        await cache_repo.set("item3", {"id": 3})
+        await cache_repo.set_many({"item1": {"id": 1}, "item2": {"id": 2}, "item3": {"id": 3}})
 
         results = await cache_repo.get_many(["item1", "item2", "item3", "item4"])
 
@@ -154,9 +194,7 @@ class TestBulkOperations:
 
     @pytest.mark.anyio
     async def test_delete_many(self, cache_repo: CacheRepository) -> None:
-        await cache_repo.set("del1", {"id": 1})
-        await cache_repo.set("del2", {"id": 2})
-        await cache_repo.set("del3", {"id": 3})
+        await cache_repo.set_many({"del1": {"id": 1}, "del2": {"id": 2}, "del3": {"id": 3}})
 
         count = await cache_repo.delete_many(["del1", "del2"])
         assert count == 2
@@ -174,9 +212,9 @@ class TestBulkOperations:
 class TestKeyPatterns:
     @pytest.mark.anyio
     async def test_keys_pattern(self, cache_repo: CacheRepository) -> None:
-        await cache_repo.set("user:1", {"id": 1})
-        await cache_repo.set("user:2", {"id": 2})
-        await cache_repo.set("product:1", {"id": 1})
+        await cache_repo.set_many(
+            {"user:1": {"id": 1}, "user:2": {"id": 2}, "product:1": {"id": 1}}
+        )
 
         user_keys = await cache_repo.keys("user:*")
         assert len(user_keys) == 2
@@ -185,9 +223,7 @@ class TestKeyPatterns:
 
     @pytest.mark.anyio
     async def test_keys_all(self, cache_repo: CacheRepository) -> None:
-        await cache_repo.set("a", {"v": 1})
-        await cache_repo.set("b", {"v": 2})
-        await cache_repo.set("c", {"v": 3})
+        await cache_repo.set_many({"a": {"v": 1}, "b": {"v": 2}, "c": {"v": 3}})
 
         all_keys = await cache_repo.keys()
         assert len(all_keys) == 3
@@ -228,11 +264,24 @@ class TestHashOperations:
         result = await cache_repo.hget("nonexistent", "field")
         assert result is None
 
+    @pytest.mark.anyio
+    async def test_hset_many(self, cache_repo: CacheRepository) -> None:
+        count = await cache_repo.hset_many("profile", {"name": "John", "age": 30})
+        assert count == 2
+
+        assert await cache_repo.hget("profile", "name") == "John"
+        assert await cache_repo.hget("profile", "age") == 30
+
+    @pytest.mark.anyio
+    async def test_hset_many_empty(self, cache_repo: CacheRepository) -> None:
+        count = await cache_repo.hset_many("profile", {})
+        assert count == 0
+
     @pytest.mark.anyio
     async def test_hgetall(self, cache_repo: CacheRepository) -> None:
-        await cache_repo.hset("profile", "name", "John")
-        await cache_repo.hset("profile", "email", "john@example.com")
-        await cache_repo.hset("profile", "age", 30)
+        await cache_repo.hset_many(
+            "profile", {"name": "John", "email": "john@example.com", "age": 30}
+        )
 
         result = await cache_repo.hgetall("profile")
         assert result["name"] == "John"
@@ -241,8 +290,7 @@ class TestHashOperations:
 
     @pytest.mark.anyio
     async def test_hdel(self, cache_repo: CacheRepository) -> None:
-        await cache_repo.hset("profile", "name", "John")
-        await cache_repo.hset("profile", "email", "john@example.com")
+        await cache_repo.hset_many("profile", {"name": "John", "email": "john@example.com"})
 
         count = await cache_repo.hdel("profile", "name")
         assert count == 1
@@ -284,20 +332,6 @@ class TestMultipleRepositories:
 class TestCustomRepository:
     @pytest.mark.anyio
     async def test_custom_serialization(self, redis_adapter: RedisAdapter) -> None:  # noqa: ARG002
-        class UserSession(BaseKeyValueRepository[dict[str, Any]]):
-            key_prefix = "user_session"
-
-            async def create_session(
-                self, user_id: str, data: dict[str, Any], ttl: int = 3600
-            ) -> bool:
-                return await self.set(f"user:{user_id}", data, ttl=ttl)
-
-            async def get_session(self, user_id: str) -> dict[str, Any] | None:
-                return await self.get(f"user:{user_id}")
-
-            async def invalidate_session(self, user_id: str) -> bool:
-                return await self.delete(f"user:{user_id}")
-
         repo = UserSession()
 
         await repo.create_session("123", {"logged_in": True, "roles": ["admin"]})
@@ -1,20 +1,22 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 import pytest
-from sqlalchemy import String
+import pytest_asyncio
+from sqlalchemy import String, event, insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.pool import StaticPool
 
 from app.infrastructure import Base
 from app.infrastructure.persistence.adapters import (
     SQLAlchemyAdapter,
     SQLConfig,
     get_registry,
-    reset_registry,
 )
 from app.infrastructure.persistence.model import SoftDeletableModel
 from app.infrastructure.persistence.repository import BaseSQLRepository
+from tests.conftest import _enable_fast_sqlite_pragmas, _restore_registry, _snapshot_registry
 
 
 class Item(SoftDeletableModel):
@@ -28,43 +30,78 @@ class ItemRepository(BaseSQLRepository[Item]):
     pass
 
 
-@pytest.fixture(scope="function")
+# Session-scoped: create_async_engine plus create_all run once for the
+# whole run instead of per test; the db_session SAVEPOINT rollback keeps
+# tests isolated without any DDL.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def db_engine() -> AsyncIterator[Any]:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    # StaticPool pins one sqlite connection so every session sees the same
+    # in-memory database instead of a fresh empty one per checkout.
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    _enable_fast_sqlite_pragmas(engine)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    # No drop_all: the in-memory database dies with the pooled connection,
+    # so dispose() alone is the whole teardown.
     await engine.dispose()
 
 
-@pytest.fixture
-async def sql_adapter(db_engine: Any) -> AsyncIterator[SQLAlchemyAdapter]:
-    reset_registry()
-    config = SQLConfig(url="sqlite+aiosqlite:///:memory:")
-    adapter = SQLAlchemyAdapter(config)
-    adapter._engine = db_engine
-    adapter._session_factory = async_sessionmaker(
+# The sessionmaker is pure configuration over the session-scoped engine;
+# build it once instead of once per test.
+@pytest.fixture(scope="session")
+def session_factory(db_engine: Any) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
         bind=db_engine,
         class_=AsyncSession,
         expire_on_commit=False,
         autoflush=False,
     )
+
+
+# Module-scoped: the adapter is stateless across tests, so one registry
+# registration covers the file; snapshot/restore keeps the singleton
+# alive instead of the per-test reset_registry churn.
+@pytest.fixture(scope="module")
+def sql_adapter(
+    db_engine: Any, session_factory: async_sessionmaker[AsyncSession]
+) -> Iterator[SQLAlchemyAdapter]:
+    snapshot = _snapshot_registry()
     registry = get_registry()
+    registry.clear()
+
+    config = SQLConfig(url="sqlite+aiosqlite:///:memory:")
+    adapter = SQLAlchemyAdapter(config)
+    adapter.configure_for_testing(db_engine, session_factory)
     registry.register("primary", adapter, set_as_default=True)
+
     yield adapter
-    reset_registry()
+    _restore_registry(snapshot)
 
 
 @pytest.fixture
 async def db_session(sql_adapter: SQLAlchemyAdapter) -> AsyncIterator[AsyncSession]:
     from app.infrastructure.core.context import _clear_sessions, _set_session
 
-    async with sql_adapter.session_factory() as session:
+    # Outer transaction + SAVEPOINT session, same idiom as tests/conftest.py:
+    # everything the test writes is rolled back without touching DDL.
+    async with sql_adapter.engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
         _set_session("primary", session)
-        yield session
-        _clear_sessions()
+        try:
+            yield session
+        finally:
+            _clear_sessions()
+            await session.close()
+            await trans.rollback()
 
 
 @pytest.fixture
@@ -72,12 +109,25 @@ def repo(db_session: AsyncSession) -> ItemRepository:  # noqa: ARG001
     return ItemRepository()
 
 
+# Single-row setup shares one pre-built INSERT ... RETURNING, so every
+# test hits the same compiled-cache entry instead of building a fresh
+# ORM flush plan.
+_INSERT_ITEM = insert(Item).returning(Item)
+
+
+@pytest.fixture
+def make_item(db_session: AsyncSession) -> Any:
+    async def _make_item(**fields: Any) -> Item:
+        result = await db_session.execute(_INSERT_ITEM, [fields])
+        return result.scalar_one()
+
+    return _make_item
+
+
 class TestSQLReadMixin:
     @pytest.mark.anyio
-    async def test_find_by_id(self, repo: ItemRepository, db_session: AsyncSession) -> None:
-        item = Item(name="Test Item")
-        db_session.add(item)
-        await db_session.flush()
+    async def test_find_by_id(self, repo: ItemRepository, make_item: Any) -> None:
+        item = await make_item(name="Test Item")
 
         found = await repo.find_by_id(item.id)
         assert found is not None
@@ -90,11 +140,9 @@ class TestSQLReadMixin:
 
     @pytest.mark.anyio
     async def test_find_by_id_excludes_deleted(
-        self, repo: ItemRepository, db_session: AsyncSession
+        self, repo: ItemRepository, make_item: Any
     ) -> None:
-        item = Item(name="Deleted Item", is_deleted=True)
-        db_session.add(item)
-        await db_session.flush()
+        item = await make_item(name="Deleted Item", is_deleted=True)
 
         found = await repo.find_by_id(item.id)
         assert found is None
@@ -104,8 +152,7 @@ class TestSQLReadMixin:
 
     @pytest.mark.anyio
     async def test_find_all(self, repo: ItemRepository, db_session: AsyncSession) -> None:
-        for i in range(5):
-            db_session.add(Item(name=f"Item {i}"))
+        db_session.add_all([Item(name=f"Item {i}") for i in range(5)])
         await db_session.flush()
 
         items = await repo.find_all()
@@ -115,18 +162,35 @@ class TestSQLReadMixin:
     async def test_find_all_with_pagination(
         self, repo: ItemRepository, db_session: AsyncSession
     ) -> None:
-        for i in range(10):
-            db_session.add(Item(name=f"Item {i}"))
+        db_session.add_all([Item(name=f"Item {i}") for i in range(10)])
         await db_session.flush()
 
         items = await repo.find_all(offset=2, limit=3)
         assert len(items) == 3
 
+    @pytest.mark.anyio
+    async def test_iter_all(self, repo: ItemRepository, db_session: AsyncSession) -> None:
+        db_session.add_all([Item(name=f"Item {i}") for i in range(5)])
+        await db_session.flush()
+
+        items = [item async for item in repo.iter_all(chunk_size=2)]
+        assert len(items) == 5
+
+    @pytest.mark.anyio
+    async def test_iter_all_excludes_deleted(
+        self, repo: ItemRepository, db_session: AsyncSession
+    ) -> None:
+        db_session.add_all([Item(name="Active Item"), Item(name="Deleted Item", is_deleted=True)])
+        await db_session.flush()
+
+        items = [item async for item in repo.iter_all()]
+        assert len(items) == 1
+        assert items[0].name == "Active Item"
+
     @pytest.mark.anyio
     async def test_find_by_ids(self, repo: ItemRepository, db_session: AsyncSession) -> None:
         items = [Item(name=f"Item {i}") for i in range(5)]
-        for item in items:
-            db_session.add(item)
+        db_session.add_all(items)
         await db_session.flush()
 
         ids = [items[0].id, items[2].id, items[4].id]
@@ -140,28 +204,30 @@ class TestSQLReadMixin:
 
     @pytest.mark.anyio
     async def test_find_where(self, repo: ItemRepository, db_session: AsyncSession) -> None:
-        db_session.add(Item(name="Cat", category="animal"))
-        db_session.add(Item(name="Dog", category="animal"))
-        db_session.add(Item(name="Car", category="vehicle"))
+        db_session.add_all(
+            [
+                Item(name="Cat", category="animal"),
+                Item(name="Dog", category="animal"),
+                Item(name="Car", category="vehicle"),
+            ]
+        )
         await db_session.flush()
 
         found = await repo.find_where(category="animal")
         assert len(found) == 2
 
     @pytest.mark.anyio
-    async def test_exists(self, repo: ItemRepository, db_session: AsyncSession) -> None:
-        item = Item(name="Existing Item")
-        db_session.add(item)
-        await db_session.flush()
+    async def test_exists(self, repo: ItemRepository, make_item: Any) -> None:
+        item = await make_item(name="Existing Item")
 
         assert await repo.exists(item.id) is True
         assert await repo.exists("nonexistent") is False
 
     @pytest.mark.anyio
     async def test_count(self, repo: ItemRepository, db_session: AsyncSession) -> None:
-        for i in range(7):
-            db_session.add(Item(name=f"Item {i}"))
-        await db_session.flush()
+        # Core executemany: one INSERT for all rows, no per-entity
+        # unit-of-work tracking needed since the test never reads them back.
+        await db_session.execute(insert(Item), [{"name": f"Item {i}"} for i in range(7)])
 
         count = await repo.count()
         assert count == 7
@@ -178,10 +244,8 @@ class TestSQLWriteMixin:
         assert item.created_at is not None
 
     @pytest.mark.anyio
-    async def test_update(self, repo: ItemRepository, db_session: AsyncSession) -> None:
-        item = Item(name="Original Name")
-        db_session.add(item)
-        await db_session.flush()
+    async def test_update(self, repo: ItemRepository, make_item: Any) -> None:
+        item = await make_item(name="Original Name")
 
         updated = await repo.update(item.id, {"name": "Updated Name"})
         assert updated is not None
@@ -193,10 +257,8 @@ class TestSQLWriteMixin:
         assert updated is None
 
     @pytest.mark.anyio
-    async def test_delete_soft(self, repo: ItemRepository, db_session: AsyncSession) -> None:
-        item = Item(name="To Delete")
-        db_session.add(item)
-        await db_session.flush()
+    async def test_delete_soft(self, repo: ItemRepository, make_item: Any) -> None:
+        item = await make_item(name="To Delete")
 
         deleted = await repo.delete(item.id)
         assert deleted is True
@@ -209,10 +271,8 @@ class TestSQLWriteMixin:
         assert found_deleted.is_deleted is True
 
     @pytest.mark.anyio
-    async def test_delete_hard(self, repo: ItemRepository, db_session: AsyncSession) -> None:
-        item = Item(name="To Delete Hard")
-        db_session.add(item)
-        await db_session.flush()
+    async def test_delete_hard(self, repo: ItemRepository, make_item: Any) -> None:
+        item = await make_item(name="To Delete Hard")
         item_id = item.id
 
         deleted = await repo.delete(item_id, hard=True)
@@ -234,6 +294,26 @@ class TestSQLBulkMixin:
         assert len(items) == 5
         assert all(item.category == "bulk" for item in items)
 
+    @pytest.mark.anyio
+    async def test_create_many_single_statement(
+        self, repo: ItemRepository, sql_adapter: SQLAlchemyAdapter
+    ) -> None:
+        inserts: list[str] = []
+
+        def _track(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+            if statement.lstrip().upper().startswith("INSERT"):
+                inserts.append(statement)
+
+        sync_engine = sql_adapter.engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _track)
+        try:
+            items = await repo.create_many([{"name": f"One Stmt {i}"} for i in range(5)])
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _track)
+
+        assert len(items) == 5
+        assert len(inserts) == 1
+
     @pytest.mark.anyio
     async def test_create_many_empty(self, repo: ItemRepository) -> None:
         items = await repo.create_many([])
@@ -242,8 +322,7 @@ class TestSQLBulkMixin:
     @pytest.mark.anyio
     async def test_update_many(self, repo: ItemRepository, db_session: AsyncSession) -> None:
         items = [Item(name=f"Item {i}", value=0) for i in range(5)]
-        for item in items:
-            db_session.add(item)
+        db_session.add_all(items)
         await db_session.flush()
 
         ids = [items[0].id, items[2].id]
@@ -256,8 +335,7 @@ class TestSQLBulkMixin:
         self, repo: ItemRepository, db_session: AsyncSession
     ) -> None:
         items = [Item(name=f"Item {i}") for i in range(5)]
-        for item in items:
-            db_session.add(item)
+        db_session.add_all(items)
         await db_session.flush()
 
         ids = [items[0].id, items[1].id, items[2].id]
@@ -272,8 +350,7 @@ class TestSQLBulkMixin:
         self, repo: ItemRepository, db_session: AsyncSession
     ) -> None:
         items = [Item(name=f"Item {i}") for i in range(5)]
-        for item in items:
-            db_session.add(item)
+        db_session.add_all(items)
         await db_session.flush()
 
         ids = [items[0].id, items[1].id]
@@ -289,9 +366,7 @@ class TestSQLPaginationMixin:
     async def test_find_paginated(
         self, repo: ItemRepository, db_session: AsyncSession
     ) -> None:
-        for i in range(25):
-            db_session.add(Item(name=f"Item {i}"))
-        await db_session.flush()
+        await db_session.execute(insert(Item), [{"name": f"Item {i}"} for i in range(25)])
 
         items, total = await repo.find_paginated(page=1, page_size=10)
         assert len(items) == 10
@@ -302,23 +377,30 @@ class TestSQLPaginationMixin:
         assert total == 25
 
     @pytest.mark.anyio
-    async def test_find_by_cursor(
+    async def test_find_paginated_page_beyond_range(
         self, repo: ItemRepository, db_session: AsyncSession
     ) -> None:
-        for i in range(10):
-            db_session.add(Item(name=f"Item {i}"))
+        db_session.add_all([Item(name=f"Item {i}") for i in range(5)])
         await db_session.flush()
 
+        items, total = await repo.find_paginated(page=3, page_size=10)
+        assert items == []
+        assert total == 5
+
+    @pytest.mark.anyio
+    async def test_find_by_cursor(
+        self, repo: ItemRepository, db_session: AsyncSession
+    ) -> None:
+        await db_session.execute(insert(Item), [{"name": f"Item {i}"} for i in range(10)])
+
         items = await repo.find_by_cursor(cursor=None, limit=5)
         assert len(items) <= 6
 
 
 class TestSQLSoftDeleteMixin:
     @pytest.mark.anyio
-    async def test_restore(self, repo: ItemRepository, db_session: AsyncSession) -> None:
-        item = Item(name="Deleted Item", is_deleted=True)
-        db_session.add(item)
-        await db_session.flush()
+    async def test_restore(self, repo: ItemRepository, make_item: Any) -> None:
+        item = await make_item(name="Deleted Item", is_deleted=True)
 
         found = await repo.find_by_id(item.id)
         assert found is None
@@ -348,6 +430,32 @@ class TestSQLUpsertMixin:
         assert item.name == "Unique Item"
         assert item.category == "upsert"
 
+    @pytest.mark.anyio
+    async def test_upsert_single_statement(
+        self, repo: ItemRepository, sql_adapter: SQLAlchemyAdapter
+    ) -> None:
+        statements: list[str] = []
+
+        def _track(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+            # Ignore the SAVEPOINT bookkeeping from the test transaction.
+            if statement.lstrip().upper().startswith(("INSERT", "SELECT")):
+                statements.append(statement)
+
+        sync_engine = sql_adapter.engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _track)
+        try:
+            item = await repo.upsert(
+                data={"name": "One Trip", "category": "upsert"},
+                conflict_fields=["name"],
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _track)
+
+        assert item.name == "One Trip"
+        # INSERT ... ON CONFLICT ... RETURNING must be the whole upsert;
+        # a SELECT-after-INSERT fallback would show up as a second statement.
+        assert len(statements) == 1
+
     @pytest.mark.anyio
     async def test_find_or_create_creates(self, repo: ItemRepository) -> None:
         item, created = await repo.find_or_create(
@@ -361,11 +469,9 @@ class TestSQLUpsertMixin:
 
     @pytest.mark.anyio
     async def test_find_or_create_finds(
-        self, repo: ItemRepository, db_session: AsyncSession
+        self, repo: ItemRepository, make_item: Any
     ) -> None:
-        existing = Item(name="Existing", category="original")
-        db_session.add(existing)
-        await db_session.flush()
+        existing = await make_item(name="Existing", category="original")
 
         item, created = await repo.find_or_create(
             name="Existing",
@@ -404,8 +510,8 @@ class TestRepositoryCustomization:
                 return await self.find_where(category=category)
 
             async def count_by_category(self, category: str) -> int:
-                items = await self.find_by_category(category)
-                return len(items)
+                # SQL COUNT(*) instead of hydrating every row to len() it.
+                return await self.count(category=category)
 
         async with sql_adapter.session_factory() as session:
             _set_session("primary", session)
@@ -21,6 +21,25 @@ class SampleSoftDeletableProfile(SoftDeletableDocument):
     name: str
 
 
+_NOW = datetime.now(UTC)
+
+
+# For tests that only need a valid instance, model_construct skips
+# validator dispatch and the per-field default factories (uuid, now).
+# Tests that assert on validation or defaults keep the real constructor.
+def _make_profile(**overrides: Any) -> SampleProfile:
+    fields: dict[str, Any] = {
+        "id": "profile-id",
+        "name": "John",
+        "email": "john@example.com",
+        "created_at": _NOW,
+        "updated_at": _NOW,
+        "metadata": {},
+    }
+    fields.update(overrides)
+    return SampleProfile.model_construct(**fields)
+
+
 class TestBaseDocument:
     def test_create_with_defaults(self) -> None:
         profile = SampleProfile(name="John", email="john@example.com")
@@ -39,7 +58,7 @@ class TestBaseDocument:
         assert profile.id == "custom-id"
 
     def test_to_document(self) -> None:
-        profile = SampleProfile(name="John", email="john@example.com")
+        profile = _make_profile()
         doc = profile.to_document()
 
         assert doc["_id"] == profile.id
@@ -48,26 +67,8 @@ class TestBaseDocument:
         assert "created_at" in doc
         assert "updated_at" in doc
 
-    def test_from_document(self) -> None:
-        now = datetime.now(UTC)
-        doc = {
-            "_id": "test-id",
-            "name": "Jane",
-            "email": "jane@example.com",
-            "created_at": now,
-            "updated_at": now,
-            "metadata": {"key": "value"},
-        }
-
-        profile = SampleProfile.from_document(doc)
-
-        assert profile.id == "test-id"
-        assert profile.name == "Jane"
-        assert profile.email == "jane@example.com"
-        assert profile.metadata == {"key": "value"}
-
     def test_update_timestamp(self) -> None:
-        profile = SampleProfile(name="John", email="john@example.com")
+        profile = _make_profile()
         original_updated = profile.updated_at
 
         profile.update_timestamp()
@@ -117,21 +118,47 @@ class TestSoftDeletableDocumentClass:
         assert doc["is_deleted"] is True
         assert doc["deleted_at"] is not None
 
-    def test_from_document_with_deleted_state(self) -> None:
-        now = datetime.now(UTC)
-        doc = {
-            "_id": "test-id",
-            "name": "John",
-            "is_deleted": True,
-            "deleted_at": now,
-            "created_at": now,
-            "updated_at": now,
-        }
-
-        profile = SampleSoftDeletableProfile.from_document(doc)
 
-        assert profile.is_deleted is True
-        assert profile.deleted_at == now
+class TestDocumentRoundTrip:
+    # from_document/to_document mapping is structurally identical across
+    # document types; one parametrized round-trip covers field projection,
+    # the _id alias, and value preservation in both directions.
+    @pytest.mark.parametrize(
+        ("document_cls", "doc"),
+        [
+            pytest.param(
+                SampleProfile,
+                {
+                    "_id": "test-id",
+                    "name": "Jane",
+                    "email": "jane@example.com",
+                    "created_at": _NOW,
+                    "updated_at": _NOW,
+                    "metadata": {"key": "value"},
+                },
+                id="profile",
+            ),
+            pytest.param(
+                SampleSoftDeletableProfile,
+                {
+                    "_id": "test-id",
+                    "name": "John",
+                    "is_deleted": True,
+                    "deleted_at": _NOW,
+                    "created_at": _NOW,
+                    "updated_at": _NOW,
+                },
+                id="soft_deleted_profile",
+            ),
+        ],
+    )
+    def test_roundtrip(self, document_cls: type[BaseDocument], doc: dict[str, Any]) -> None:
+        entity = document_cls.from_document(doc)
+        assert entity.id == doc["_id"]
+
+        round_tripped = entity.to_document()
+        for key, value in doc.items():
+            assert round_tripped[key] == value
 
 
 class TestDocumentValidation:
@@ -153,13 +180,11 @@ class TestDocumentValidation:
         assert not hasattr(profile, "extra_field")
 
     def test_nested_metadata(self) -> None:
-        profile = SampleProfile(
-            name="John",
-            email="john@example.com",
+        profile = _make_profile(
             metadata={
                 "preferences": {"theme": "dark", "language": "en"},
                 "tags": ["admin", "verified"],
-            },
+            }
         )
 
         doc = profile.to_document()
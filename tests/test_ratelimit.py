@@ -0,0 +1,109 @@
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.types import Receive, Scope, Send
+
+from app.infrastructure.web.ratelimit import (
+    RateLimitMiddleware,
+    RedisSlidingWindow,
+    TokenBucket,
+    parse_limit,
+)
+from tests._stubs import areturn
+
+
+async def _ok_app(scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG001
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _client(middleware: RateLimitMiddleware) -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test")
+
+
+class TestParseLimit:
+    @pytest.mark.parametrize(
+        ("spec", "expected"),
+        [
+            pytest.param("100/minute", (100, 60), id="slash"),
+            pytest.param("100 per minute", (100, 60), id="per"),
+            pytest.param("5/second", (5, 1), id="second"),
+            pytest.param("1000/hour", (1000, 3600), id="hour"),
+            pytest.param("50/day", (50, 86400), id="day"),
+            pytest.param("10/3 seconds", (10, 3), id="multiplier"),
+            pytest.param("10 per 2 minutes", (10, 120), id="per-multiplier"),
+        ],
+    )
+    def test_valid(self, spec: str, expected: tuple[int, int]) -> None:
+        assert parse_limit(spec) == expected
+
+    @pytest.mark.parametrize("spec", ["100", "abc/minute", "100/fortnight", "per minute"])
+    def test_invalid(self, spec: str) -> None:
+        with pytest.raises(ValueError, match="Invalid rate limit spec"):
+            parse_limit(spec)
+
+
+class TestTokenBucket:
+    # acquire takes the clock as an argument, so the tests drive time
+    # explicitly instead of sleeping.
+    def test_deny_when_drained(self) -> None:
+        bucket = TokenBucket(rate=1.0, capacity=2.0)
+        bucket.last = 0.0
+        assert bucket.acquire(0.0) is True
+        assert bucket.acquire(0.0) is True
+        assert bucket.acquire(0.0) is False
+
+    def test_refill(self) -> None:
+        bucket = TokenBucket(rate=1.0, capacity=1.0)
+        bucket.last = 0.0
+        assert bucket.acquire(0.0) is True
+        assert bucket.acquire(0.5) is False
+        assert bucket.acquire(1.5) is True
+
+    def test_refill_caps_at_capacity(self) -> None:
+        bucket = TokenBucket(rate=10.0, capacity=2.0)
+        bucket.last = 0.0
+        assert bucket.acquire(100.0) is True
+        assert bucket.acquire(100.0) is True
+        assert bucket.acquire(100.0) is False
+
+
+class TestRateLimitMiddleware:
+    @pytest.mark.anyio
+    async def test_over_limit_returns_429(self) -> None:
+        middleware = RateLimitMiddleware(_ok_app, limit="2/minute")
+
+        async with _client(middleware) as client:
+            assert (await client.get("/")).status_code == 200
+            assert (await client.get("/")).status_code == 200
+            response = await client.get("/")
+
+        assert response.status_code == 429
+        assert response.headers["content-type"] == "application/problem+json"
+        assert response.json()["status"] == 429
+
+    @pytest.mark.anyio
+    async def test_redis_window_admits_after_local_deny(self) -> None:
+        middleware = RateLimitMiddleware(_ok_app, limit="1/minute")
+        middleware._redis_window = RedisSlidingWindow(1, 60)
+
+        with patch.object(middleware._redis_window, "allow", areturn(True)):
+            async with _client(middleware) as client:
+                assert (await client.get("/")).status_code == 200
+                assert (await client.get("/")).status_code == 200
+
+    @pytest.mark.anyio
+    async def test_redis_unavailable_denies_without_crashing(self) -> None:
+        middleware = RateLimitMiddleware(_ok_app, limit="1/minute")
+        middleware._redis_window = RedisSlidingWindow(1, 60)
+
+        with patch(
+            "app.infrastructure.messaging.cache.get_redis",
+            side_effect=ConnectionError("redis down"),
+        ):
+            async with _client(middleware) as client:
+                assert (await client.get("/")).status_code == 200
+                response = await client.get("/")
+
+        assert response.status_code == 429
@@ -1,9 +1,14 @@
+from types import SimpleNamespace
+
 import pytest
 from httpx import AsyncClient
 
 
+# One POST -> GET -> PATCH -> DELETE -> GET flow: the CRUD endpoints all
+# hinge on the same created todo, so a single scenario covers them with
+# one fixture setup instead of four.
 @pytest.mark.anyio
-async def test_create_todo(client: AsyncClient) -> None:
+async def test_todo_crud_flow(client: AsyncClient) -> None:
     response = await client.post(
         "/api/v1/todos",
         json={"title": "Test Todo", "description": "Test description"},
@@ -14,12 +19,33 @@ async def test_create_todo(client: AsyncClient) -> None:
     assert data["description"] == "Test description"
     assert data["completed"] is False
     assert "id" in data
+    todo_id = data["id"]
+
+    response = await client.get(f"/api/v1/todos/{todo_id}")
+    assert response.status_code == 200
+    assert response.json()["title"] == "Test Todo"
+
+    response = await client.patch(
+        f"/api/v1/todos/{todo_id}",
+        json={"title": "Updated", "completed": True},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "Updated"
+    assert data["completed"] is True
+
+    response = await client.delete(f"/api/v1/todos/{todo_id}")
+    assert response.status_code == 204
+
+    response = await client.get(f"/api/v1/todos/{todo_id}")
+    assert response.status_code == 404
 
 
 @pytest.mark.anyio
-async def test_list_todos(client: AsyncClient) -> None:
-    await client.post("/api/v1/todos", json={"title": "Todo 1"})
-    await client.post("/api/v1/todos", json={"title": "Todo 2"})
+async def test_list_todos(client: AsyncClient, todo_factory: SimpleNamespace) -> None:
+    # Setup rows don't exercise the POST endpoint; seed them in one batch
+    # through the factory instead of serialized HTTP round trips.
+    await todo_factory.create_batch(2)
 
     response = await client.get("/api/v1/todos")
     assert response.status_code == 200
@@ -34,9 +60,8 @@ async def test_list_todos(client: AsyncClient) -> None:
 
 
 @pytest.mark.anyio
-async def test_list_todos_pagination(client: AsyncClient) -> None:
-    for i in range(5):
-        await client.post("/api/v1/todos", json={"title": f"Todo {i}"})
+async def test_list_todos_pagination(client: AsyncClient, todo_factory: SimpleNamespace) -> None:
+    await todo_factory.create_batch(5)
 
     response = await client.get("/api/v1/todos", params={"page": 1, "page_size": 2})
     assert response.status_code == 200
@@ -50,16 +75,6 @@ async def test_list_todos_pagination(client: AsyncClient) -> None:
     assert data["has_prev"] is False
 
 
-@pytest.mark.anyio
-async def test_get_todo(client: AsyncClient) -> None:
-    create_response = await client.post("/api/v1/todos", json={"title": "Get Me"})
-    todo_id = create_response.json()["id"]
-
-    response = await client.get(f"/api/v1/todos/{todo_id}")
-    assert response.status_code == 200
-    assert response.json()["title"] == "Get Me"
-
-
 @pytest.mark.anyio
 async def test_get_todo_not_found(client: AsyncClient) -> None:
     response = await client.get("/api/v1/todos/00000000-0000-0000-0000-000000000000")
@@ -72,38 +87,11 @@ async def test_get_todo_not_found(client: AsyncClient) -> None:
 
 
 @pytest.mark.anyio
-async def test_update_todo(client: AsyncClient) -> None:
-    create_response = await client.post("/api/v1/todos", json={"title": "Update Me"})
-    todo_id = create_response.json()["id"]
-
-    response = await client.patch(
-        f"/api/v1/todos/{todo_id}",
-        json={"title": "Updated", "completed": True},
-    )
-    assert response.status_code == 200
-    data = response.json()
-    assert data["title"] == "Updated"
-    assert data["completed"] is True
-
-
-@pytest.mark.anyio
-async def test_delete_todo(client: AsyncClient) -> None:
-    create_response = await client.post("/api/v1/todos", json={"title": "Delete Me"})
-    todo_id = create_response.json()["id"]
-
-    response = await client.delete(f"/api/v1/todos/{todo_id}")
-    assert response.status_code == 204
-
-    get_response = await client.get(f"/api/v1/todos/{todo_id}")
-    assert get_response.status_code == 404
-
-
-@pytest.mark.anyio
-async def test_filter_todos_by_completed(client: AsyncClient) -> None:
-    await client.post("/api/v1/todos", json={"title": "Incomplete"})
-    create_response = await client.post("/api/v1/todos", json={"title": "Complete"})
-    todo_id = create_response.json()["id"]
-    await client.patch(f"/api/v1/todos/{todo_id}", json={"completed": True})
+async def test_filter_todos_by_completed(
+    client: AsyncClient, todo_factory: SimpleNamespace
+) -> None:
+    await todo_factory.create(title="Incomplete")
+    await todo_factory.create(title="Complete", completed=True)
 
     response = await client.get("/api/v1/todos", params={"completed": True})
     assert response.status_code == 200